@@ -1,45 +1,52 @@
-import asyncio
+import time
 from datetime import datetime
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
 import click
 
-from sdtctl.systemd import SystemdTimerManager, TimerInfo
+if TYPE_CHECKING:
+    from sdtctl.systemd import TimerInfo
 
+# Divisor and suffix for past times under an hour, a day and a week
+_PAST_TIME_UNITS = ((60, 'm ago'), (3600, 'h ago'), (86400, 'd ago'))
 
-def format_timer_time(dt: datetime | None) -> str:
+
+def format_timer_time(dt: datetime | None, now: float) -> str:
     """Format datetime for display in timer table.
+
+    Args:
+        dt: Datetime to format
+        now: Current time as a POSIX timestamp
     """
     if dt is None:
         return 'N/A'
 
-    now = datetime.now(dt.tzinfo)
-    diff = dt - now
-
-    if diff.total_seconds() < 0:
-        # Past time
-        diff = now - dt
-        if diff.total_seconds() < 3600:
-            return f'{int(diff.total_seconds() / 60)}m ago'
-        elif diff.total_seconds() < 86400:
-            return f'{int(diff.total_seconds() / 3600)}h ago'
-        elif diff.total_seconds() < 604800:
-            days = int(diff.total_seconds() / 86400)
-            return f'{days}d ago'
-        else:
-            return dt.strftime('%Y-%m-%d')
-    else:
-        if diff.total_seconds() < 3600:
-            return f'in {int(diff.total_seconds() / 60)}m'
-        elif diff.total_seconds() < 86400:
-            hours = int(diff.total_seconds() / 3600)
-            minutes = int((diff.total_seconds() % 3600) / 60)
-            return f'in {hours}h {minutes}m'
-        else:
-            return dt.strftime('%Y-%m-%d %H:%M')
+    seconds = dt.timestamp() - now
+
+    if seconds < 0:
+        # Past time, pick the unit by how many thresholds were crossed
+        seconds = -seconds
+        index = (seconds >= 3600) + (seconds >= 86400) + (seconds >= 604800)
+        if index == len(_PAST_TIME_UNITS):
+            return f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d}'
+
+        divisor, suffix = _PAST_TIME_UNITS[index]
+        return f'{int(seconds / divisor)}{suffix}'
+
+    if seconds < 3600:
+        return f'in {int(seconds / 60)}m'
+    if seconds < 86400:
+        hours, remainder = divmod(int(seconds), 3600)
+        return f'in {hours}h {remainder // 60}m'
+    return (
+        f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} '
+        f'{dt.hour:02d}:{dt.minute:02d}'
+    )
 
 
 def format_timers_table(
-    timers: list[TimerInfo],
+    timers: list['TimerInfo'],
     show_full: bool = False,
 ) -> str:
     """Format timers into a simple table.
@@ -47,63 +54,43 @@ def format_timers_table(
     if not timers:
         return 'No timers found.'
 
-    # Calculate column widths
-    name_width = max(len('TIMER'), max(len(t.name) for t in timers))
-    state_width = max(
-        len('STATE'),
-        max(len(t.active_state.value) for t in timers),
-    )
-    next_width = max(
-        len('NEXT'),
-        max(len(format_timer_time(t.next_elapse)) for t in timers),
-    )
-    last_width = max(
-        len('LAST'),
-        max(len(format_timer_time(t.last_trigger)) for t in timers),
-    )
+    now = time.time()
 
-    lines = []
+    # Format cells and track column widths in a single pass
+    name_width = len('TIMER')
+    state_width = len('STATE')
+    next_width = len('NEXT')
+    last_width = len('LAST')
 
-    if show_full:
-        header = (
-            f'{'TIMER':<{name_width}} '
-            f'{'STATE':<{state_width}} '
-            f'{'NEXT':<{next_width}} '
-            f'{'LAST':<{last_width}} '
-            f'DESCRIPTION'
-        )
-    else:
-        header = (
-            f'{'TIMER':<{name_width}} '
-            f'{'STATE':<{state_width}} '
-            f'{'NEXT':<{next_width}} '
-            f'{'LAST':<{last_width}}'
+    rows = []
+    for timer in sorted(timers, key=attrgetter('name')):
+        state_str = timer.active_state
+        next_str = format_timer_time(timer.next_elapse, now)
+        last_str = format_timer_time(timer.last_trigger, now)
+
+        name_width = max(name_width, len(timer.name))
+        state_width = max(state_width, len(state_str))
+        next_width = max(next_width, len(next_str))
+        last_width = max(last_width, len(last_str))
+
+        rows.append(
+            (timer.name, state_str, next_str, last_str, timer.description)
         )
 
-    lines.append(header)
-    lines.append('-' * len(header))
-
-    for timer in sorted(timers, key=lambda t: t.name):
-        next_str = format_timer_time(timer.next_elapse)
-        last_str = format_timer_time(timer.last_trigger)
-
-        if show_full:
-            row = (
-                f'{timer.name:<{name_width}} '
-                f'{timer.active_state.value:<{state_width}} '
-                f'{next_str:<{next_width}} '
-                f'{last_str:<{last_width}} '
-                f'{timer.description}'
-            )
-        else:
-            row = (
-                f'{timer.name:<{name_width}} '
-                f'{timer.active_state.value:<{state_width}} '
-                f'{next_str:<{next_width}} '
-                f'{last_str:<{last_width}}'
-            )
-
-        lines.append(row)
+    # Build the row template once, the widths are known at this point
+    template = (
+        f'{{:<{name_width}}} '
+        f'{{:<{state_width}}} '
+        f'{{:<{next_width}}} '
+        f'{{:<{last_width}}}'
+    )
+    if show_full:
+        template += ' {}'
+
+    header = template.format('TIMER', 'STATE', 'NEXT', 'LAST', 'DESCRIPTION')
+
+    lines = [header, '-' * len(header)]
+    lines.extend(template.format(*row) for row in rows)
 
     return '\n'.join(lines)
 
@@ -117,6 +104,11 @@ def format_timers_table(
 def list_timers(full: bool) -> None:
     """List all systemd timers.
     """
+    # D-Bus and the models are only loaded when the command actually runs,
+    # not when the CLI is merely set up or asked for --help
+    from sdtctl.systemd import SystemdTimerManager
+    from sdtctl.utils import run_async
+
     async def _list_timers() -> None:
         try:
             manager = SystemdTimerManager()
@@ -126,4 +118,4 @@ def list_timers(full: bool) -> None:
         except Exception as e:
             click.echo(f'Error: {e}', err=True)
 
-    asyncio.run(_list_timers())
+    run_async(_list_timers())
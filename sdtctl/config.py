@@ -1,11 +1,18 @@
 import logging
-
-from systemd.journal import JournalHandler
+import os
 
 
 def setup_logger() -> None:
     """Configure logging to use systemd journal.
+
+    Journal logging is skipped when SDTCTL_NO_JOURNAL is set, in which
+    case libsystemd is never loaded.
     """
+    if os.environ.get('SDTCTL_NO_JOURNAL'):
+        return
+
+    from systemd.journal import JournalHandler
+
     app_logger = logging.getLogger('sdtctl')
     app_logger.setLevel(logging.DEBUG)
 
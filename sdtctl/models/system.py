@@ -1,48 +1,68 @@
+import os
 import time
+from dataclasses import dataclass
 from typing import Self
 
-from pydantic import Field
 
-from sdtctl.utils import BaseModel
-
-
-class SystemBootInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SystemBootInfo:
     """System boot time information.
 
     Args:
         boot_time_seconds: Boot time in seconds since epoch
     """
-    model_config = {'frozen': True}
 
-    boot_time_seconds: int = Field(..., gt=0)
+    boot_time_seconds: int
+
+    def __post_init__(self) -> None:
+        if self.boot_time_seconds <= 0:
+            raise ValueError('Boot time must be positive')
 
     @classmethod
     def from_proc_stat(cls) -> Self:
         """Read boot time from /proc/stat.
         """
         try:
-            with open('/proc/stat') as f:
-                for line in f:
-                    if line.startswith('btime '):
-                        boot_time = int(line.split()[1])
-                        return cls(boot_time_seconds=boot_time)
-        except (OSError, IndexError, ValueError) as e:
+            data = _read_proc_file('/proc/stat')
+
+            # Find the btime line directly instead of walking the per-CPU
+            # and interrupt lines before it, btime is never the first line
+            start = data.find(b'\nbtime ')
+            if start == -1:
+                raise RuntimeError('Boot time not found in /proc/stat')
+
+            start += len(b'\nbtime ')
+            end = data.find(b'\n', start)
+            boot_time = int(data[start:end if end != -1 else None])
+            return cls(boot_time_seconds=boot_time)
+        except (OSError, ValueError) as e:
             raise RuntimeError(
                 f'Failed to read boot time from /proc/stat: {e}'
             )
 
-        raise RuntimeError('Boot time not found in /proc/stat')
-
     @classmethod
     def from_proc_uptime_fallback(cls) -> Self:
         """Fallback method using /proc/uptime.
         """
         try:
-            with open('/proc/uptime') as uptime_file:
-                uptime_seconds = float(uptime_file.read().split()[0])
-                boot_time = int(time.time() - uptime_seconds)
-                return cls(boot_time_seconds=boot_time)
+            data = _read_proc_file('/proc/uptime')
+            uptime_seconds = float(data.split()[0])
+            boot_time = int(time.time() - uptime_seconds)
+            return cls(boot_time_seconds=boot_time)
         except (OSError, IndexError, ValueError) as e:
             raise RuntimeError(
                 f'Failed to read uptime from /proc/uptime: {e}'
             )
+
+
+def _read_proc_file(path: str) -> bytes:
+    """Read a /proc file through a raw descriptor, without io buffering.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
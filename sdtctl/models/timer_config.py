@@ -1,5 +1,5 @@
+import os
 import re
-import shlex
 from enum import StrEnum
 from pathlib import Path
 
@@ -7,6 +7,9 @@ from pydantic import Field, field_validator, model_validator
 
 from sdtctl.utils import BaseModel
 
+# Characters allowed in a systemd unit name
+_TIMER_NAME_PATTERN = re.compile(r'[a-zA-Z0-9:_.\\-]+')
+
 
 class ServiceType(StrEnum):
     SIMPLE = 'simple'
@@ -45,16 +48,16 @@ class TimerSchedule(BaseModel):
     """
     model_config = {'frozen': True}
 
-    calendar_spec: str | None = Field(None)
+    calendar_spec: str | None = None
     on_boot_sec: int | None = Field(None, ge=0)
     on_startup_sec: int | None = Field(None, ge=0)
     on_unit_active_sec: int | None = Field(None, ge=0)
     on_unit_inactive_sec: int | None = Field(None, ge=0)
     accuracy_sec: int = Field(60, ge=0)
     randomized_delay_sec: int = Field(0, ge=0)
-    persistent: bool = Field(False)
-    wake_system: bool = Field(False)
-    remain_after_elapse: bool = Field(True)
+    persistent: bool = False
+    wake_system: bool = False
+    remain_after_elapse: bool = True
 
     @field_validator('calendar_spec')
     @classmethod
@@ -70,13 +73,13 @@ class TimerSchedule(BaseModel):
 
     @model_validator(mode='after')
     def validate_at_least_one_schedule(self) -> 'TimerSchedule':
-        if not any([
-            self.calendar_spec,
-            self.on_boot_sec,
-            self.on_startup_sec,
-            self.on_unit_active_sec,
-            self.on_unit_inactive_sec
-        ]):
+        if not (
+            self.calendar_spec
+            or self.on_boot_sec
+            or self.on_startup_sec
+            or self.on_unit_active_sec
+            or self.on_unit_inactive_sec
+        ):
             raise ValueError('At least one schedule type must be specified')
         return self
 
@@ -96,30 +99,66 @@ class ServiceConfig(BaseModel):
     model_config = {'frozen': True}
 
     exec_start: str = Field(..., min_length=1)
-    user: str | None = Field(None)
-    group: str | None = Field(None)
-    working_directory: Path | None = Field(None)
-    environment: dict[str, str] | None = Field(None)
-    type: ServiceType = Field(ServiceType.ONESHOT)
-    restart: RestartPolicy = Field(RestartPolicy.NO)
+    user: str | None = None
+    group: str | None = None
+    working_directory: Path | None = None
+    environment: dict[str, str] | None = None
+    type: ServiceType = ServiceType.ONESHOT
+    restart: RestartPolicy = RestartPolicy.NO
 
     @field_validator('exec_start')
     @classmethod
     def validate_command(cls, v: str) -> str:
-        try:
-            shlex.split(v)
-        except ValueError as e:
-            raise ValueError(f'Invalid command format: {e}')
+        # Unbalanced quotes and a trailing escape are the only malformed
+        # cases, a command without any of these characters needs no scan
+        if '"' in v or "'" in v or '\\' in v:
+            error = _find_quoting_error(v)
+            if error is not None:
+                raise ValueError(f'Invalid command format: {error}')
         return v
 
     @field_validator('working_directory')
     @classmethod
     def validate_working_directory(cls, v: Path | None) -> Path | None:
-        if v is not None and not v.is_dir():
+        if v is not None and not os.path.isdir(v):
             raise ValueError(f'Working directory does not exist: {v}')
         return v
 
 
+def _find_quoting_error(command: str) -> str | None:
+    """Check quoting of a command the way POSIX shlex.split() does.
+
+    Single quotes take everything literally up to the closing quote, a
+    backslash escapes the next character outside of them.
+
+    Args:
+        command: Command line to check
+
+    Returns:
+        Error message matching shlex, or None if the quoting is balanced
+    """
+    quote = None
+    escaped = False
+    for char in command:
+        if escaped:
+            escaped = False
+        elif quote is None:
+            if char == '\\':
+                escaped = True
+            elif char == '"' or char == "'":
+                quote = char
+        elif char == quote:
+            quote = None
+        elif char == '\\' and quote == '"':
+            escaped = True
+
+    if escaped:
+        return 'No escaped character'
+    if quote is not None:
+        return 'No closing quotation'
+    return None
+
+
 class TimerCreationConfig(BaseModel):
     """Complete configuration for creating a new timer.
 
@@ -136,7 +175,7 @@ class TimerCreationConfig(BaseModel):
     description: str = Field(..., min_length=1)
     timer_schedule: TimerSchedule
     service_config: ServiceConfig
-    enabled: bool = Field(True)
+    enabled: bool = True
 
     @field_validator('name')
     @classmethod
@@ -145,7 +184,7 @@ class TimerCreationConfig(BaseModel):
         base_name = v.removesuffix('.timer')
 
         # Systemd unit name validation
-        if not re.match(r'^[a-zA-Z0-9:_.\\-]+$', base_name):
+        if not _TIMER_NAME_PATTERN.fullmatch(base_name):
             raise ValueError(
                 'Timer name contains invalid characters. '
                 'Use only letters, numbers, :, _, ., \\, -'
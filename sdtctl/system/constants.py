@@ -1,16 +1,16 @@
-from enum import StrEnum
+from typing import Final
 
 
-class SystemdPaths(StrEnum):
+class SystemdPaths:
     """Systemd directory paths.
     """
 
     # System-level unit directories
-    SYSTEM_UNIT_DIR = '/etc/systemd/system'
+    SYSTEM_UNIT_DIR: Final[str] = '/etc/systemd/system'
 
     # User-level unit directories (relative to home)
-    USER_CONFIG_DIR = '.config/systemd/user'
+    USER_CONFIG_DIR: Final[str] = '.config/systemd/user'
 
     # Backup directories
-    SYSTEM_BACKUP_DIR = '/var/backups/systemd'
-    USER_BACKUP_DIR = '.local/share/systemd/backups'
+    SYSTEM_BACKUP_DIR: Final[str] = '/var/backups/systemd'
+    USER_BACKUP_DIR: Final[str] = '.local/share/systemd/backups'
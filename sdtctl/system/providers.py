@@ -1,3 +1,5 @@
+import functools
+
 from sdtctl.models.system import SystemBootInfo
 
 
@@ -7,8 +9,18 @@ class ProcSystemBootTimeProvider:
 
     def get_boot_time(self) -> SystemBootInfo:
         """Get system boot time from /proc/stat with fallback.
+
+        The boot time does not change while the system is up, so it is
+        read once per process and shared by all providers.
         """
-        try:
-            return SystemBootInfo.from_proc_stat()
-        except RuntimeError:
-            return SystemBootInfo.from_proc_uptime_fallback()
+        return _read_boot_time()
+
+
+@functools.cache
+def _read_boot_time() -> SystemBootInfo:
+    """Read system boot time from /proc/stat with fallback.
+    """
+    try:
+        return SystemBootInfo.from_proc_stat()
+    except RuntimeError:
+        return SystemBootInfo.from_proc_uptime_fallback()
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import shutil
@@ -180,11 +181,8 @@ class UnitFileManager:
     ) -> dict[str, Path | str]:
         """Prepare timer and service file paths.
         """
-        timer_name = self._ensure_suffix(timer_name, '.timer')
-        service_name = self._ensure_suffix(
-            timer_name.removesuffix('.timer'),
-            '.service',
-        )
+        timer_name = _ensure_suffix(timer_name, '.timer')
+        service_name = _service_name(timer_name)
 
         timer_path = await self.get_unit_file_path(
             timer_name,
@@ -360,11 +358,8 @@ class UnitFileManager:
         """Remove timer and service unit files (for rollback).
         """
         try:
-            timer_name = self._ensure_suffix(unit_name, '.timer')
-            service_name = self._ensure_suffix(
-                unit_name.removesuffix('.timer'),
-                '.service',
-            )
+            timer_name = _ensure_suffix(unit_name, '.timer')
+            service_name = _service_name(unit_name)
 
             timer_path = await self.get_unit_file_path(
                 timer_name,
@@ -398,11 +393,6 @@ class UnitFileManager:
             )
             return False
 
-    def _ensure_suffix(self, name: str, suffix: str) -> str:
-        """Ensure name has the specified suffix.
-        """
-        return name if name.endswith(suffix) else f'{name}{suffix}'
-
     async def write_unit_file(
         self,
         unit_name: str,
@@ -445,14 +435,18 @@ class UnitFileManager:
             temp_path.rename(unit_path)
             unit_path.chmod(0o644)
 
-            self._logger.info(f'Successfully wrote unit file: {unit_path}')
+            self._logger.info('Successfully wrote unit file: %s', unit_path)
             return unit_path
 
         except Exception as e:
             # Clean up temp file on error
             if temp_path.exists():
                 temp_path.unlink()
-            self._logger.error(f'Failed to write unit file {unit_name}: {e}')
+            self._logger.error(
+                'Failed to write unit file %s: %s',
+                unit_name,
+                e,
+            )
             raise
 
     async def remove_unit_file(
@@ -476,13 +470,38 @@ class UnitFileManager:
             unit_path = await self.get_unit_file_path(unit_name, system_level)
 
             if not unit_path.exists():
-                self._logger.debug(f'Unit file does not exist: {unit_path}')
+                self._logger.debug('Unit file does not exist: %s', unit_path)
                 return False
 
             unit_path.unlink()
-            self._logger.info(f'Removed unit file: {unit_path}')
+            self._logger.info('Removed unit file: %s', unit_path)
             return True
 
         except Exception as e:
-            self._logger.error(f'Failed to remove unit file {unit_name}: {e}')
+            self._logger.error(
+                'Failed to remove unit file %s: %s',
+                unit_name,
+                e,
+            )
             raise
+
+
+@functools.lru_cache(maxsize=1024)
+def _ensure_suffix(name: str, suffix: str) -> str:
+    """Ensure name has the specified suffix.
+
+    Cached, bulk operations ask for the same few unit names repeatedly.
+    """
+    return name if name.endswith(suffix) else f'{name}{suffix}'
+
+
+@functools.lru_cache(maxsize=1024)
+def _service_name(unit_name: str) -> str:
+    """Get the name of the service unit that a timer triggers.
+
+    Cached like _ensure_suffix, so repeated names skip both the suffix
+    checks and the slicing.
+    """
+    if unit_name.endswith('.timer'):
+        unit_name = unit_name[:-6]
+    return _ensure_suffix(unit_name, '.service')
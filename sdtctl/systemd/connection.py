@@ -1,34 +1,28 @@
 import asyncio
+import functools
 import logging
-import threading
 from typing import Self
 
 from dbus_next.aio.message_bus import MessageBus
 from dbus_next.constants import BusType
 from dbus_next.errors import DBusError
+from dbus_next.introspection import Node
 
 from sdtctl.systemd.types import ConnectionConfig, DBusConstants
 
 
-class SingletonMeta(type):
-    """Metaclass that creates a singleton instance.
-    """
-
-    _instances = {}
-    _lock = threading.Lock()
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
-                    instance = super().__call__(*args, **kwargs)
-                    cls._instances[cls] = instance
-        return cls._instances[cls]
-
-
-class DBusConnectionManager(metaclass=SingletonMeta):
+class DBusConnectionManager:
     """Manages the D-Bus connection with automatic reconnection.
     """
+    __slots__ = (
+        '_logger',
+        '_bus_type',
+        '_bus',
+        '_max_retries',
+        '_initial_backoff',
+        '_connection_lock',
+        '_health_check_introspection',
+    )
 
     def __init__(
         self,
@@ -44,10 +38,6 @@ class DBusConnectionManager(metaclass=SingletonMeta):
             max_retries: The maximum number of connection retries.
             initial_backoff: The initial backoff delay in seconds for retries.
         """
-        # Prevent re-initialization of singleton
-        if hasattr(self, '_initialized'):
-            return
-
         self._logger = logging.getLogger(__name__)
 
         self._bus_type = bus_type
@@ -55,7 +45,7 @@ class DBusConnectionManager(metaclass=SingletonMeta):
         self._max_retries = max_retries
         self._initial_backoff = initial_backoff
         self._connection_lock = asyncio.Lock()
-        self._initialized = True
+        self._health_check_introspection: Node | None = None
 
     async def connect(self) -> None:
         """Connects to the D-Bus with an exponential backoff retry mechanism.
@@ -149,7 +139,9 @@ class DBusConnectionManager(metaclass=SingletonMeta):
     async def get_bus(self) -> MessageBus:
         """Returns the MessageBus object, ensuring a connection is established.
 
-        If the connection is lost, it will attempt to reconnect.
+        If the connection is lost, it will attempt to reconnect. The state of
+        an existing connection is taken from the bus itself without a
+        round-trip, use health_check() for an explicit check.
 
         Returns:
             The connected MessageBus object.
@@ -157,7 +149,7 @@ class DBusConnectionManager(metaclass=SingletonMeta):
         Raises:
             ConnectionError: If a connection cannot be established.
         """
-        if not await self.health_check():
+        if not self._is_already_connected():
             self._logger.warning(
                 'D-Bus connection is down. Attempting to reconnect.'
             )
@@ -192,10 +184,14 @@ class DBusConnectionManager(metaclass=SingletonMeta):
     async def _perform_health_check_call(self) -> bool:
         """Perform the actual D-Bus health check call.
         """
-        introspection = await self._bus.introspect(  # type: ignore
-            DBusConstants.SERVICE_NAME,
-            DBusConstants.OBJECT_PATH,
-        )
+        # The D-Bus daemon interface never changes, introspect it only once
+        introspection = self._health_check_introspection
+        if introspection is None:
+            introspection = await self._bus.introspect(  # type: ignore
+                DBusConstants.SERVICE_NAME,
+                DBusConstants.OBJECT_PATH,
+            )
+            self._health_check_introspection = introspection
         proxy = self._bus.get_proxy_object(  # type: ignore
             DBusConstants.SERVICE_NAME,
             DBusConstants.OBJECT_PATH,
@@ -206,6 +202,7 @@ class DBusConnectionManager(metaclass=SingletonMeta):
         return True
 
     @classmethod
+    @functools.cache
     def get_instance(cls) -> Self:
         """Returns the singleton instance of DBusConnectionManager.
 
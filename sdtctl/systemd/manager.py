@@ -1,8 +1,18 @@
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import fields
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+from dbus_next.aio.message_bus import MessageBus
+from dbus_next.aio.proxy_object import ProxyInterface
+from dbus_next.constants import MessageType
 from dbus_next.errors import DBusError
+from dbus_next.introspection import Node
+from dbus_next.message import Message
 
 from sdtctl.system.providers import ProcSystemBootTimeProvider
 from sdtctl.system.unit_file_manager import UnitFileManager
@@ -10,7 +20,6 @@ from sdtctl.systemd.connection import DBusConnectionManager
 from sdtctl.systemd.models import (
     DBusTimerProperties,
     DBusUnitData,
-    DBusVariantValue,
     TimerCreationRequest,
     TimerCreationResult,
     TimerInfo,
@@ -18,8 +27,10 @@ from sdtctl.systemd.models import (
     TimerPreview,
 )
 from sdtctl.systemd.types import (
+    SYSTEMD_MANAGER_INTROSPECTION,
     DBusConstants,
     SystemdDBusConstants,
+    TimerManagerConfig,
     TimerOperation,
     TimerPropertyNames,
     UnitActiveState,
@@ -27,26 +38,138 @@ from sdtctl.systemd.types import (
     UnitFileState,
     UnitLoadState,
 )
+from sdtctl.systemd.unit_generator import (
+    generate_service_unit,
+    generate_timer_unit,
+)
 from sdtctl.utils import StandardTimeConverter
 
+# Plain string copies of the constants used for every listed timer, so the
+# per-timer path does not go through enum member lookups
+_SYSTEMD_SERVICE_NAME = SystemdDBusConstants.SERVICE_NAME.value
+_TIMER_INTERFACE = SystemdDBusConstants.TIMER_INTERFACE.value
+_PROPERTIES_INTERFACE = DBusConstants.PROPERTIES_INTERFACE.value
+_PROPERTIES_GET_ALL_METHOD = DBusConstants.PROPERTIES_GET_ALL_METHOD.value
+_TIMER_UNIT_PATTERN = f'*{SystemdDBusConstants.TIMER_SUFFIX}'
+
+_MANAGER_INTROSPECTION = Node.parse(SYSTEMD_MANAGER_INTROSPECTION)
+
+# Properties of a timer systemd reported none for; the dataclass is frozen,
+# so one instance is shared by every such timer
+_EMPTY_TIMER_PROPERTIES = DBusTimerProperties()
+
+# D-Bus names of the DBusTimerProperties fields; plain string keys skip
+# the slower enum member hashing on lookup
+_TIMER_PROPERTY_NAMES = {
+    'next_elapse_realtime_usec':
+        TimerPropertyNames.NEXT_ELAPSE_REALTIME_USEC.value,
+    'next_elapse_monotonic_usec':
+        TimerPropertyNames.NEXT_ELAPSE_MONOTONIC_USEC.value,
+    'last_trigger_usec': TimerPropertyNames.LAST_TRIGGER_USEC.value,
+    'result': TimerPropertyNames.RESULT.value,
+    'accuracy_usec': TimerPropertyNames.ACCURACY_USEC.value,
+    'randomized_delay_usec': TimerPropertyNames.RANDOMIZED_DELAY_USEC.value,
+    'persistent': TimerPropertyNames.PERSISTENT.value,
+    'wake_system': TimerPropertyNames.WAKE_SYSTEM.value,
+    'remain_after_elapse': TimerPropertyNames.REMAIN_AFTER_ELAPSE.value,
+}
+
+# Field name, D-Bus name and default of every DBusTimerProperties field,
+# the defaults are taken from the dataclass itself
+_TIMER_PROPERTY_FIELDS = tuple(
+    (field.name, _TIMER_PROPERTY_NAMES[field.name], field.default)
+    for field in fields(DBusTimerProperties)
+)
+
+# Manager methods implementing the unit control operations
+_UNIT_CONTROL_METHODS = {
+    TimerOperation.START: 'start_unit',
+    TimerOperation.STOP: 'stop_unit',
+    TimerOperation.RESTART: 'restart_unit',
+}
+
+# Match rule for property changes of systemd timer units
+_TIMER_PROPERTIES_CHANGED_RULE = (
+    f"type='signal',"
+    f"sender='{SystemdDBusConstants.SERVICE_NAME}',"
+    f"interface='{DBusConstants.PROPERTIES_INTERFACE}',"
+    f"member='{DBusConstants.PROPERTIES_CHANGED_SIGNAL}',"
+    f"arg0='{SystemdDBusConstants.TIMER_INTERFACE}'"
+)
+
 
 class SystemdTimerManager:
     """Unified manager for all systemd timer operations via D-Bus.
 
     This is the main interface for interacting with systemd timers.
     """
-
-    def __init__(self) -> None:
+    __slots__ = (
+        '_logger',
+        '_max_concurrent_calls',
+        '_units_cache_ttl',
+        '_watch_changes',
+        '_connection',
+        '_file_manager',
+        '_time_converter',
+        '_boot_provider',
+        '_manager_proxy',
+        '_manager_bus',
+        '_subscribed_bus',
+        '_subscription_task',
+        '_timer_properties_cache',
+        '_timer_properties_generations',
+        '_units_cache',
+    )
+
+    def __init__(
+        self,
+        connection: DBusConnectionManager | None = None,
+        max_concurrent_calls: int = TimerManagerConfig.MAX_CONCURRENT_CALLS,
+        units_cache_ttl: float = TimerManagerConfig.UNITS_CACHE_TTL,
+        watch_changes: bool = False,
+    ) -> None:
         """Initialize the manager with required dependencies.
+
+        Args:
+            connection: D-Bus connection manager to use, defaults to the
+                shared instance so all managers use a single connection
+            max_concurrent_calls: Maximum number of per-timer D-Bus calls
+                in flight at once while listing timers
+            units_cache_ttl: Seconds the listed timer units are reused by
+                later listings, zero (the default) disables the cache.
+                Only this manager's own operations invalidate it, so
+                changes made by other clients show up after the TTL
+            watch_changes: Subscribe to systemd signals and cache timer
+                properties between listings, meant for long-lived callers
+                that call close() when done
         """
         self._logger = logging.getLogger(__name__)
 
-        self._connection = DBusConnectionManager.get_instance()
+        self._max_concurrent_calls = max_concurrent_calls
+        self._units_cache_ttl = units_cache_ttl
+        self._watch_changes = watch_changes
+
+        self._connection = connection or DBusConnectionManager.get_instance()
         self._file_manager = UnitFileManager()
         self._time_converter = StandardTimeConverter()
         self._boot_provider = ProcSystemBootTimeProvider()
-        self._boot_info = None
-        self._manager_proxy = None
+        self._manager_proxy: ProxyInterface | None = None
+        self._manager_bus = None
+        self._subscribed_bus = None
+        self._subscription_task: asyncio.Task | None = None
+
+        # Timer properties by object path, kept up to date by signals
+        self._timer_properties_cache: dict[str, dict[str, Any]] = {}
+
+        # Change counter per object path, bumped whenever the properties
+        # of the path may have changed, so a fetch that was in flight at
+        # that moment is not cached
+        self._timer_properties_generations: dict[str, int] = {}
+
+        # Listed timer units and file states with the time of the listing
+        self._units_cache: (
+            tuple[float, list[Any], dict[str, str]] | None
+        ) = None
 
     async def list_timers(self) -> list[TimerInfo]:
         """List all systemd timers with their information.
@@ -54,25 +177,58 @@ class SystemdTimerManager:
         Returns:
             List of TimerInfo objects containing timer details
         """
-        try:
-            await self._ensure_manager_proxy()
-            units_data = await self._manager_proxy.call_list_units()  # type: ignore
+        return [timer_info async for timer_info in self.iter_timers()]
 
-            timers = []
-            for unit_data in units_data:
-                if self._is_timer_unit(unit_data[0]):
-                    timer_info = await self._build_timer_info(unit_data)
-                    if timer_info:
-                        timers.append(timer_info)
+    async def iter_timers(self) -> AsyncIterator[TimerInfo]:
+        """Iterate over all systemd timers as their information arrives.
 
-            return timers
+        Timers are yielded in completion order, not in unit list order.
 
+        Returns:
+            Async iterator of TimerInfo objects containing timer details
+        """
+        try:
+            units_data, file_states = await self._list_timer_units()
         except DBusError as e:
-            self._logger.error(f'Failed to list timers: {e}')
-            return []
+            self._logger.error('Failed to list timers: %s', e)
+            return
         except Exception as e:
-            self._logger.error(f'Unexpected error listing timers: {e}')
-            return []
+            self._logger.error('Unexpected error listing timers: %s', e)
+            return
+
+        if not units_data:
+            return
+
+        # Fetch properties of all timers concurrently, bounded so the
+        # bus is not flooded on hosts with many timers
+        semaphore = asyncio.Semaphore(self._max_concurrent_calls)
+        tasks = [
+            asyncio.create_task(
+                self._build_timer_info(unit_data, file_states, semaphore)
+            )
+            for unit_data in units_data
+        ]
+
+        failed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                timer_info = await next_done
+                if timer_info:
+                    yield timer_info
+                else:
+                    failed += 1
+        finally:
+            # The consumer may stop early, do not leave fetches running
+            for task in tasks:
+                task.cancel()
+
+        # Reported once instead of per timer, the details are debug logged
+        if failed:
+            self._logger.warning(
+                'Failed to build timer info for %d of %d timers',
+                failed,
+                len(tasks),
+            )
 
     async def create_timer(
         self,
@@ -88,46 +244,95 @@ class SystemdTimerManager:
         Returns:
             TimerCreationResult with creation details
         """
-        try:
-            # Generate unit file contents
-            timer_content = self._generate_timer_unit(request)
-            service_content = self._generate_service_unit(request)
-
-            # Write unit files
-            timer_path = await self._file_manager.write_unit_file(
-                f'{request.name}.timer',
-                timer_content,
-                system_level,
-            )
-            service_path = await self._file_manager.write_unit_file(
-                f'{request.name}.service',
-                service_content,
-                system_level,
-            )
+        results = await self.create_timers([request], system_level)
+        return results[0]
 
-            # Reload systemd and enable timer
-            await self._reload_daemon()
-            enabled = await self._enable_timer(request.name)
+    async def create_timers(
+        self,
+        requests: list[TimerCreationRequest],
+        system_level: bool = True,
+    ) -> list[TimerCreationResult]:
+        """Create and install several timers with a single daemon reload.
+
+        Unit files of all timers are written first, then systemd is
+        reloaded and the timers are enabled once for all of them. A request
+        repeating the name of an earlier one fails without being written.
+
+        Args:
+            requests: Timer creation configurations
+            system_level: Whether to install at system level
 
-            return TimerCreationResult(
+        Returns:
+            TimerCreationResult for each request, in the given order
+        """
+        # A repeated name would write the same unit files concurrently,
+        # only its first request is created
+        first_index: dict[str, int] = {}
+        for index, request in enumerate(requests):
+            first_index.setdefault(request.name, index)
+
+        unique_written = await asyncio.gather(
+            *(
+                self._write_timer_unit_files(requests[index], system_level)
+                for index in first_index.values()
+            ),
+            return_exceptions=True,
+        )
+        written_by_name = dict(zip(first_index, unique_written))
+        written = [
+            written_by_name[request.name]
+            if first_index[request.name] == index
+            else ValueError(f'Duplicate timer name: {request.name}')
+            for index, request in enumerate(requests)
+        ]
+
+        timer_names = [
+            request.name
+            for request, paths in zip(requests, written)
+            if not isinstance(paths, BaseException)
+        ]
+
+        enabled = False
+        install_error = None
+        if timer_names:
+            try:
+                # Reload systemd and enable timers
+                await self._reload_daemon()
+                enabled = await self._enable_timers(timer_names)
+            except Exception as e:
+                install_error = e
+
+        results = []
+        for request, paths in zip(requests, written):
+            error = paths if isinstance(paths, BaseException) \
+                else install_error
+            if error is not None:
+                self._logger.error(
+                    'Failed to create timer %s: %s',
+                    request.name,
+                    error,
+                )
+                results.append(TimerCreationResult(
+                    success=False,
+                    timer_name=request.name,
+                    timer_path=None,
+                    service_path=None,
+                    enabled=False,
+                    error_message=str(error),
+                ))
+                continue
+
+            timer_path, service_path = paths
+            results.append(TimerCreationResult(
                 success=True,
                 timer_name=request.name,
                 timer_path=timer_path,
                 service_path=service_path,
                 enabled=enabled,
                 error_message='',
-            )
+            ))
 
-        except Exception as e:
-            self._logger.error(f'Failed to create timer {request.name}: {e}')
-            return TimerCreationResult(
-                success=False,
-                timer_name=request.name,
-                timer_path=None,
-                service_path=None,
-                enabled=False,
-                error_message=str(e),
-            )
+        return results
 
     async def delete_timer(
         self,
@@ -146,7 +351,7 @@ class SystemdTimerManager:
         try:
             # Stop and disable first
             await self._stop_timer(timer_name)
-            await self._disable_timer(timer_name)
+            await self._disable_timers([timer_name])
 
             # Remove unit files
             timer_file = f'{timer_name}.timer'
@@ -170,7 +375,11 @@ class SystemdTimerManager:
             )
 
         except Exception as e:
-            self._logger.error(f'Failed to delete timer {timer_name}: {e}')
+            self._logger.error(
+                'Failed to delete timer %s: %s',
+                timer_name,
+                e,
+            )
             return TimerOperationResult(
                 success=False,
                 timer_name=timer_name,
@@ -221,25 +430,8 @@ class SystemdTimerManager:
         Returns:
             TimerOperationResult with operation details
         """
-        try:
-            enabled = await self._enable_timer(timer_name)
-            return TimerOperationResult(
-                success=enabled,
-                timer_name=timer_name,
-                operation=TimerOperation.ENABLE,
-                message=f'Timer {timer_name} enabled' \
-                    if enabled else 'Failed to enable timer',
-                job_path='',
-            )
-        except Exception as e:
-            self._logger.error(f'Failed to enable timer {timer_name}: {e}')
-            return TimerOperationResult(
-                success=False,
-                timer_name=timer_name,
-                operation=TimerOperation.ENABLE,
-                message=str(e),
-                job_path='',
-            )
+        results = await self.enable_timers([timer_name])
+        return results[0]
 
     async def disable_timer(self, timer_name: str) -> TimerOperationResult:
         """Disable a timer.
@@ -250,25 +442,93 @@ class SystemdTimerManager:
         Returns:
             TimerOperationResult with operation details
         """
-        try:
-            disabled = await self._disable_timer(timer_name)
-            return TimerOperationResult(
-                success=disabled,
-                timer_name=timer_name,
-                operation=TimerOperation.DISABLE,
-                message=f'Timer {timer_name} disabled' \
-                    if disabled else 'Failed to disable timer',
-                job_path='',
-            )
-        except Exception as e:
-            self._logger.error(f'Failed to disable timer {timer_name}: {e}')
-            return TimerOperationResult(
-                success=False,
-                timer_name=timer_name,
-                operation=TimerOperation.DISABLE,
-                message=str(e),
-                job_path='',
-            )
+        results = await self.disable_timers([timer_name])
+        return results[0]
+
+    async def start_timers(
+        self,
+        timer_names: list[str],
+    ) -> list[TimerOperationResult]:
+        """Start several timers concurrently.
+
+        Args:
+            timer_names: Names of the timers to start
+
+        Returns:
+            TimerOperationResult for each timer, in the given order
+        """
+        return await self._control_timers(timer_names, TimerOperation.START)
+
+    async def stop_timers(
+        self,
+        timer_names: list[str],
+    ) -> list[TimerOperationResult]:
+        """Stop several timers concurrently.
+
+        Args:
+            timer_names: Names of the timers to stop
+
+        Returns:
+            TimerOperationResult for each timer, in the given order
+        """
+        return await self._control_timers(timer_names, TimerOperation.STOP)
+
+    async def restart_timers(
+        self,
+        timer_names: list[str],
+    ) -> list[TimerOperationResult]:
+        """Restart several timers concurrently.
+
+        Args:
+            timer_names: Names of the timers to restart
+
+        Returns:
+            TimerOperationResult for each timer, in the given order
+        """
+        return await self._control_timers(
+            timer_names,
+            TimerOperation.RESTART,
+        )
+
+    async def enable_timers(
+        self,
+        timer_names: list[str],
+    ) -> list[TimerOperationResult]:
+        """Enable several timers with a single systemd call and reload.
+
+        Prefer this over enable_timer in a loop, which reloads the
+        daemon once per timer.
+
+        Args:
+            timer_names: Names of the timers to enable
+
+        Returns:
+            TimerOperationResult for each timer, in the given order
+        """
+        return await self._change_unit_files(
+            timer_names,
+            TimerOperation.ENABLE,
+        )
+
+    async def disable_timers(
+        self,
+        timer_names: list[str],
+    ) -> list[TimerOperationResult]:
+        """Disable several timers with a single systemd call and reload.
+
+        Prefer this over disable_timer in a loop, which reloads the
+        daemon once per timer.
+
+        Args:
+            timer_names: Names of the timers to disable
+
+        Returns:
+            TimerOperationResult for each timer, in the given order
+        """
+        return await self._change_unit_files(
+            timer_names,
+            TimerOperation.DISABLE,
+        )
 
     async def preview_timer(
         self,
@@ -282,8 +542,8 @@ class SystemdTimerManager:
         Returns:
             TimerPreview with unit file contents and paths
         """
-        timer_content = self._generate_timer_unit(request)
-        service_content = self._generate_service_unit(request)
+        timer_content = generate_timer_unit(request)
+        service_content = generate_service_unit(request)
 
         timer_path = await self._file_manager.get_unit_file_path(
             f'{request.name}.timer',
@@ -364,46 +624,255 @@ class SystemdTimerManager:
         result = await self.disable_timer(timer_name)
         return result.success
 
-    async def _ensure_manager_proxy(self) -> None:
+    async def _ensure_manager_proxy(self) -> ProxyInterface:
         """Ensure the systemd manager proxy is initialized.
-        """
-        if self._manager_proxy is not None:
-            return
 
+        The proxy is rebuilt when the connection has been re-established,
+        since a proxy stays bound to the bus it was created on.
+
+        Returns:
+            The systemd manager interface proxy
+        """
         bus = await self._connection.get_bus()
-        introspection = await bus.introspect(
-            SystemdDBusConstants.SERVICE_NAME,
-            SystemdDBusConstants.OBJECT_PATH,
-        )
+        if self._manager_proxy is not None and bus is self._manager_bus:
+            return self._manager_proxy
+
+        # Handlers are registered through the old proxy, drop them before
+        # it is replaced; changes on the old connection went unnoticed, so
+        # nothing cached through it can be trusted
+        if self._subscribed_bus is not None:
+            self._remove_signal_handlers(self._subscribed_bus)
+            self._subscribed_bus = None
+            self._invalidate_timer_properties()
+
         proxy_object = bus.get_proxy_object(
             SystemdDBusConstants.SERVICE_NAME,
             SystemdDBusConstants.OBJECT_PATH,
-            introspection,
+            _MANAGER_INTROSPECTION,
         )
         self._manager_proxy = proxy_object.get_interface(
             SystemdDBusConstants.MANAGER_INTERFACE
         )
+        self._manager_bus = bus
+
+        # Subscribe in the background, callers do not depend on it and the
+        # round-trips overlap with their own calls
+        if self._watch_changes:
+            self._subscription_task = asyncio.create_task(
+                self._subscribe_to_timer_changes(bus)
+            )
+        return self._manager_proxy
 
-    def _is_timer_unit(self, unit_name: str) -> bool:
-        """Check if a unit name represents a timer.
+    async def _subscribe_to_timer_changes(self, bus: MessageBus) -> None:
+        """Subscribe to signals that keep the timer properties cache valid.
+
+        Properties are only cached while the subscription is active, so a
+        failure here leaves every lookup going to D-Bus. Runs as a
+        background task, so all errors are logged rather than raised.
         """
-        return unit_name.endswith(SystemdDBusConstants.TIMER_SUFFIX)
+        self._invalidate_timer_properties()
+        match_added = False
+        try:
+            await _call_raw(bus, self._match_rule_message(
+                DBusConstants.ADD_MATCH_METHOD,
+            ))
+            match_added = True
+
+            bus.add_message_handler(self._on_bus_message)
+            self._manager_proxy.on_unit_new(  # type: ignore
+                self._on_unit_new
+            )
+            self._manager_proxy.on_unit_removed(  # type: ignore
+                self._on_unit_removed
+            )
+            self._manager_proxy.on_reloading(  # type: ignore
+                self._on_reloading
+            )
+            await self._manager_proxy.call_subscribe()  # type: ignore
+            self._subscribed_bus = bus
+        except Exception as e:
+            self._logger.warning('Failed to subscribe to timer changes: %s', e)
+            self._remove_signal_handlers(bus)
+            if match_added:
+                await self._remove_match_rule(bus)
+
+    async def close(self) -> None:
+        """Stop receiving change signals and drop all cached data.
+
+        With watch_changes, signal handlers are registered on the shared
+        bus and keep the manager alive, call this once it is no longer
+        needed.
+        The systemd Subscribe call is not undone, since it applies to the
+        whole connection that other managers may share.
+        """
+        task = self._subscription_task
+        self._subscription_task = None
+        if task is not None and not task.done():
+            # Let it finish, so there is no half-registered state left
+            await task
+
+        bus = self._subscribed_bus
+        self._subscribed_bus = None
+        if bus is not None:
+            self._remove_signal_handlers(bus)
+            if bus.connected:
+                await self._remove_match_rule(bus)
+
+        self._invalidate_timer_properties()
+        self._units_cache = None
+
+    def _remove_signal_handlers(self, bus: MessageBus) -> None:
+        """Remove the signal handlers registered by the subscription.
+
+        Handlers that were never registered are skipped.
+        """
+        bus.remove_message_handler(self._on_bus_message)
+        self._manager_proxy.off_unit_new(  # type: ignore
+            self._on_unit_new
+        )
+        self._manager_proxy.off_unit_removed(  # type: ignore
+            self._on_unit_removed
+        )
+        self._manager_proxy.off_reloading(  # type: ignore
+            self._on_reloading
+        )
+
+    async def _remove_match_rule(self, bus: MessageBus) -> None:
+        """Remove the timer property changes match rule from the bus.
+        """
+        try:
+            await _call_raw(bus, self._match_rule_message(
+                DBusConstants.REMOVE_MATCH_METHOD,
+            ))
+        except Exception as e:
+            self._logger.debug('Failed to remove match rule: %s', e)
+
+    def _match_rule_message(self, method: str) -> Message:
+        """Build a bus daemon call for the timer property changes rule.
+        """
+        return Message(
+            destination=DBusConstants.SERVICE_NAME,
+            path=DBusConstants.OBJECT_PATH,
+            interface=DBusConstants.INTERFACE,
+            member=method,
+            signature='s',
+            body=[_TIMER_PROPERTIES_CHANGED_RULE],
+        )
+
+    def _on_bus_message(self, message: Message) -> None:
+        """Apply timer property changes to the properties cache.
+        """
+        if message.message_type != MessageType.SIGNAL \
+            or message.member != DBusConstants.PROPERTIES_CHANGED_SIGNAL \
+            or message.interface != _PROPERTIES_INTERFACE:
+            return
+
+        interface_name, changed, invalidated = message.body
+        if interface_name != _TIMER_INTERFACE:
+            return
+
+        props = self._timer_properties_cache.get(message.path)
+        if props is None or invalidated:
+            # Not cached yet, or values were not sent along; either way a
+            # fetch that is in flight must not cache what it gets back
+            self._invalidate_timer_properties(message.path)
+            return
+
+        self._bump_timer_properties_generation(message.path)
+
+        for name, variant in changed.items():
+            props[name] = variant.value
+
+    def _invalidate_timer_properties(
+        self,
+        object_path: str | None = None,
+    ) -> None:
+        """Drop cached timer properties of one path, or of all of them.
+
+        Fetches in flight for the affected paths will not be cached.
+        """
+        if object_path is not None:
+            self._timer_properties_cache.pop(object_path, None)
+            self._bump_timer_properties_generation(object_path)
+            return
+
+        self._timer_properties_cache.clear()
+        for path in self._timer_properties_generations:
+            self._timer_properties_generations[path] += 1
+
+    def _bump_timer_properties_generation(self, object_path: str) -> None:
+        """Mark the properties of a path as changed.
+        """
+        generations = self._timer_properties_generations
+        if object_path in generations:
+            generations[object_path] += 1
+
+    def _on_unit_new(self, unit_name: str, object_path: str) -> None:
+        """Drop the listed units when a timer unit gets loaded.
+        """
+        if unit_name.endswith(SystemdDBusConstants.TIMER_SUFFIX):
+            self._units_cache = None
+
+    def _on_unit_removed(self, unit_name: str, object_path: str) -> None:
+        """Drop cached data of an unloaded unit.
+        """
+        self._invalidate_timer_properties(object_path)
+        if unit_name.endswith(SystemdDBusConstants.TIMER_SUFFIX):
+            self._units_cache = None
+
+    def _on_reloading(self, active: bool) -> None:
+        """Drop all cached data when systemd reloads its units.
+        """
+        self._invalidate_timer_properties()
+        self._units_cache = None
+
+    async def _list_timer_units(self) -> tuple[list[Any], dict[str, str]]:
+        """Get timer unit rows and unit file states, reusing recent ones.
+
+        Returns:
+            Raw unit rows and mapping of unit name to unit file state
+        """
+        if self._units_cache is not None:
+            listed_at, units_data, file_states = self._units_cache
+            if time.monotonic() - listed_at < self._units_cache_ttl:
+                return units_data, file_states
+
+        # Let systemd filter the units instead of shipping all of them
+        units_data, file_states = await asyncio.gather(
+            self._call_manager(
+                'list_units_by_patterns',
+                [],
+                [_TIMER_UNIT_PATTERN],
+            ),
+            self._get_timer_unit_file_states(),
+        )
+        self._units_cache = (time.monotonic(), units_data, file_states)
+        return units_data, file_states
 
     async def _build_timer_info(
         self,
         unit_data: list[Any],
+        file_states: dict[str, str],
+        semaphore: asyncio.Semaphore,
     ) -> TimerInfo | None:
         """Build TimerInfo from raw unit data.
         """
         try:
             # Parse raw unit data into structured format
-            dbus_data = self._parse_unit_data(unit_data)
+            dbus_data = DBusUnitData.from_dbus_row(unit_data)
 
-            # Get timer properties and file state
-            timer_props = await self._get_timer_properties(
-                dbus_data.object_path,
-            )
-            file_state = await self._get_unit_file_state(dbus_data.name)
+            async with semaphore:
+                timer_props = await self._get_timer_properties(
+                    dbus_data.object_path,
+                )
+
+                # Units without a unit file (e.g. transient ones) are not
+                # in the batch result, ask for their state individually
+                file_state = file_states.get(dbus_data.name)
+                if file_state is None:
+                    file_state = await self._get_unit_file_state(
+                        dbus_data.name,
+                    )
 
             # Build and return timer info
             return self._create_timer_info(
@@ -413,27 +882,13 @@ class SystemdTimerManager:
             )
 
         except Exception as e:
-            self._logger.warning(
-                f'Failed to build timer info for {unit_data[0]}: {e}'
+            self._logger.debug(
+                'Failed to build timer info for %s: %s',
+                unit_data[0],
+                e,
             )
             return None
 
-    def _parse_unit_data(self, unit_data: list[Any]) -> DBusUnitData:
-        """Parse raw unit data list into DBusUnitData.
-        """
-        return DBusUnitData(
-            name=unit_data[0],
-            description=unit_data[1],
-            load_state=unit_data[2],
-            active_state=unit_data[3],
-            sub_state=unit_data[4],
-            following=unit_data[5],
-            object_path=unit_data[6],
-            job_id=unit_data[7],
-            job_type=unit_data[8],
-            job_object_path=unit_data[9],
-        )
-
     def _create_timer_info(
         self,
         dbus_data: DBusUnitData,
@@ -461,86 +916,91 @@ class SystemdTimerManager:
         self,
         object_path: str,
     ) -> DBusTimerProperties:
-        """Get timer properties from D-Bus.
+        """Get timer properties from the cache or from D-Bus.
         """
-        # Get properties interface for the timer
-        properties_interface = await self._get_properties_interface(
-            object_path
-        )
+        props = self._timer_properties_cache.get(object_path)
+        if props is None:
+            # Cache only values fetched while change signals are already
+            # being received, and only if no signal touched the path while
+            # the call was in flight, so no change can slip in unnoticed
+            cacheable = self._subscribed_bus is not None \
+                and self._subscribed_bus is self._manager_bus
+            generation = self._timer_properties_generations.setdefault(
+                object_path,
+                0,
+            )
 
-        # Fetch raw properties from D-Bus
-        raw_props = await properties_interface.call_get_all( # type: ignore
-            SystemdDBusConstants.TIMER_INTERFACE
-        )
+            props = await self._fetch_timer_properties(object_path)
+            unchanged = generation \
+                == self._timer_properties_generations[object_path]
+            if cacheable and unchanged:
+                self._timer_properties_cache[object_path] = props
 
         # Convert and return as structured data
-        return self._convert_raw_properties_to_timer_properties(raw_props)
+        return self._convert_raw_properties_to_timer_properties(props)
 
-    async def _get_properties_interface(self, object_path: str):
-        """Get D-Bus properties interface for given object path.
+    async def _fetch_timer_properties(
+        self,
+        object_path: str,
+    ) -> dict[str, Any]:
+        """Fetch timer properties from D-Bus as plain Python values.
         """
         bus = await self._connection.get_bus()
-        introspection = await bus.introspect(
-            SystemdDBusConstants.SERVICE_NAME,
-            object_path,
-        )
-        proxy_object = bus.get_proxy_object(
-            SystemdDBusConstants.SERVICE_NAME,
-            object_path,
-            introspection,
-        )
-        return proxy_object.get_interface(
-            DBusConstants.PROPERTIES_INTERFACE
-        )
+
+        # Plain method call, so no proxy object or introspection data is
+        # needed per timer
+        body = await _call_raw(bus, Message(
+            destination=_SYSTEMD_SERVICE_NAME,
+            path=object_path,
+            interface=_PROPERTIES_INTERFACE,
+            member=_PROPERTIES_GET_ALL_METHOD,
+            signature='s',
+            body=[_TIMER_INTERFACE],
+        ))
+
+        # GetAll always returns variants, unwrap them to Python values
+        raw_props = body[0]
+        return {name: variant.value for name, variant in raw_props.items()}
 
     def _convert_raw_properties_to_timer_properties(
         self,
-        raw_props: dict[str, Any],
+        props: dict[str, Any],
     ) -> DBusTimerProperties:
-        """Convert raw D-Bus properties to DBusTimerProperties.
+        """Convert unwrapped D-Bus properties to DBusTimerProperties.
         """
-        # Convert variants to Python values
-        props = {}
-        for name, variant in raw_props.items():
-            props[name] = DBusVariantValue.from_dbus_variant(variant).value
+        if not props:
+            return _EMPTY_TIMER_PROPERTIES
 
-        return DBusTimerProperties(
-            next_elapse_realtime_usec=props.get(
-                TimerPropertyNames.NEXT_ELAPSE_REALTIME_USEC,
-                0,
-            ),
-            next_elapse_monotonic_usec=props.get(
-                TimerPropertyNames.NEXT_ELAPSE_MONOTONIC_USEC,
-                0,
-            ),
-            last_trigger_usec=props.get(TimerPropertyNames.LAST_TRIGGER_USEC),
-            result=props.get(TimerPropertyNames.RESULT),
-            accuracy_usec=props.get(
-                TimerPropertyNames.ACCURACY_USEC,
-                60000000,
-            ),
-            randomized_delay_usec=props.get(
-                TimerPropertyNames.RANDOMIZED_DELAY_USEC,
-                0,
-            ),
-            persistent=props.get(TimerPropertyNames.PERSISTENT, False),
-            wake_system=props.get(TimerPropertyNames.WAKE_SYSTEM, False),
-            remain_after_elapse=props.get(
-                TimerPropertyNames.REMAIN_AFTER_ELAPSE,
-                True,
-            ),
-        )
+        return DBusTimerProperties(**{
+            field_name: props.get(name, default)
+            for field_name, name, default in _TIMER_PROPERTY_FIELDS
+        })
 
     async def _get_unit_file_state(self, unit_name: str) -> str:
         """Get unit file state.
         """
-        await self._ensure_manager_proxy()
         try:
-            return await self._manager_proxy.call_get_unit_file_state( # type: ignore
-                unit_name
-            )
+            return await self._call_manager('get_unit_file_state', unit_name)
         except DBusError:
-            return UnitFileState.DISABLED.value
+            return UnitFileState.DISABLED
+
+    async def _get_timer_unit_file_states(self) -> dict[str, str]:
+        """Get file states of all timer unit files in a single call.
+
+        Returns:
+            Mapping of unit name to unit file state
+        """
+        try:
+            unit_files = await self._call_manager(
+                'list_unit_files_by_patterns',
+                [],
+                [_TIMER_UNIT_PATTERN],
+            )
+        except DBusError as e:
+            self._logger.warning('Failed to list timer unit files: %s', e)
+            return {}
+
+        return {Path(path).name: state for path, state in unit_files}
 
     def _convert_next_elapse(
         self,
@@ -566,15 +1026,11 @@ class SystemdTimerManager:
         """Convert monotonic time to datetime using system boot info.
         """
         try:
-            # Get boot info if not cached
-            if self._boot_info is None:
-                self._boot_info = self._boot_provider.get_boot_time()
-
             return self._time_converter.convert_monotonic_to_datetime(
-                monotonic_usec, self._boot_info
+                monotonic_usec, self._boot_provider.get_boot_time()
             )
         except Exception as e:
-            self._logger.warning(f'Failed to convert monotonic time: {e}')
+            self._logger.warning('Failed to convert monotonic time: %s', e)
             return None
 
     def _convert_last_trigger(
@@ -597,7 +1053,6 @@ class SystemdTimerManager:
         """Generic timer control operation.
         """
         try:
-            await self._ensure_manager_proxy()
             unit_name = f'{timer_name}.timer'
 
             # Execute the operation
@@ -605,18 +1060,22 @@ class SystemdTimerManager:
                 unit_name,
                 operation,
             )
+            self._units_cache = None
 
             return TimerOperationResult(
                 success=True,
                 timer_name=timer_name,
                 operation=operation,
-                message=f'Timer {timer_name} {operation.value}ed successfully',
+                message=f'Timer {timer_name} {operation}ed successfully',
                 job_path=job_path,
             )
 
         except Exception as e:
             self._logger.error(
-                f'Failed to {operation.value} timer {timer_name}: {e}'
+                'Failed to %s timer %s: %s',
+                operation,
+                timer_name,
+                e,
             )
             return TimerOperationResult(
                 success=False,
@@ -626,6 +1085,83 @@ class SystemdTimerManager:
                 job_path='',
             )
 
+    async def _write_timer_unit_files(
+        self,
+        request: TimerCreationRequest,
+        system_level: bool,
+    ) -> tuple[Path, Path]:
+        """Generate and write timer and service unit files.
+
+        Returns:
+            Paths of the written timer and service unit files
+        """
+        timer_content = generate_timer_unit(request)
+        service_content = generate_service_unit(request)
+
+        timer_path = await self._file_manager.write_unit_file(
+            f'{request.name}.timer',
+            timer_content,
+            system_level,
+        )
+        service_path = await self._file_manager.write_unit_file(
+            f'{request.name}.service',
+            service_content,
+            system_level,
+        )
+        return timer_path, service_path
+
+    async def _control_timers(
+        self,
+        timer_names: list[str],
+        operation: TimerOperation,
+    ) -> list[TimerOperationResult]:
+        """Run a control operation on several timers concurrently.
+        """
+        return list(await asyncio.gather(*(
+            self._control_timer(timer_name, operation)
+            for timer_name in timer_names
+        )))
+
+    async def _change_unit_files(
+        self,
+        timer_names: list[str],
+        operation: TimerOperation,
+    ) -> list[TimerOperationResult]:
+        """Enable or disable several timers with a single systemd call.
+        """
+        if not timer_names:
+            return []
+
+        change = self._enable_timers \
+            if operation == TimerOperation.ENABLE else self._disable_timers
+
+        try:
+            success = await change(timer_names)
+            error = None
+        except Exception as e:
+            self._logger.error(
+                'Failed to %s timers %s: %s',
+                operation,
+                ', '.join(timer_names),
+                e,
+            )
+            success = False
+            error = str(e)
+
+        return [
+            TimerOperationResult(
+                success=success,
+                timer_name=timer_name,
+                operation=operation,
+                message=error or (
+                    f'Timer {timer_name} {operation}d'
+                    if success else f'Failed to {operation} timer'
+                ),
+                job_path='',
+            )
+            for timer_name in timer_names
+        ]
+
     async def _execute_timer_operation(
         self,
         unit_name: str,
@@ -633,238 +1169,110 @@ class SystemdTimerManager:
     ) -> str:
         """Execute specific timer operation via D-Bus.
         """
-        if operation == TimerOperation.START:
-            return await self._manager_proxy.call_start_unit(  # type: ignore
-                unit_name,
-                UnitControlModes.REPLACE,
-            )
-        elif operation == TimerOperation.STOP:
-            return await self._manager_proxy.call_stop_unit(  # type: ignore
-                unit_name,
-                UnitControlModes.REPLACE,
-            )
-        elif operation == TimerOperation.RESTART:
-            return await self._manager_proxy.call_restart_unit(  # type: ignore
-                unit_name,
-                UnitControlModes.REPLACE,
-            )
-        else:
+        method = _UNIT_CONTROL_METHODS.get(operation)
+        if method is None:
             raise ValueError(f'Unsupported operation: {operation}')
 
+        return await self._call_manager(
+            method,
+            unit_name,
+            UnitControlModes.REPLACE,
+        )
+
     async def _stop_timer(self, timer_name: str) -> None:
         """Stop timer (internal helper).
         """
-        await self._ensure_manager_proxy()
-        unit_name = f'{timer_name}.timer'
         try:
-            await self._manager_proxy.call_stop_unit(  # type: ignore
-                unit_name, UnitControlModes.REPLACE
+            await self._call_manager(
+                'stop_unit',
+                f'{timer_name}.timer',
+                UnitControlModes.REPLACE,
             )
         except DBusError:
             pass  # Ignore if already stopped
 
-    async def _enable_timer(self, timer_name: str) -> bool:
-        """Enable timer (internal helper).
+    async def _enable_timers(self, timer_names: list[str]) -> bool:
+        """Enable timers and reload the daemon once (internal helper).
         """
-        await self._ensure_manager_proxy()
-        unit_file = f'{timer_name}.timer'
         try:
-            result = await self._manager_proxy.call_enable_unit_files(  # type: ignore
-                [unit_file], False, True
+            result = await self._call_manager(
+                'enable_unit_files',
+                [f'{timer_name}.timer' for timer_name in timer_names],
+                False,
+                True,
             )
             await self._reload_daemon()
             return result[0]  # carries_install_info
         except DBusError as e:
-            self._logger.error(f'Failed to enable timer {timer_name}: {e}')
+            self._logger.error(
+                'Failed to enable timers %s: %s',
+                ', '.join(timer_names),
+                e,
+            )
             return False
 
-    async def _disable_timer(self, timer_name: str) -> bool:
-        """Disable timer (internal helper).
+    async def _disable_timers(self, timer_names: list[str]) -> bool:
+        """Disable timers and reload the daemon once (internal helper).
         """
-        await self._ensure_manager_proxy()
-        unit_file = f'{timer_name}.timer'
         try:
-            await self._manager_proxy.call_disable_unit_files(  # type: ignore
-                [unit_file], False
+            await self._call_manager(
+                'disable_unit_files',
+                [f'{timer_name}.timer' for timer_name in timer_names],
+                False,
             )
             await self._reload_daemon()
             return True
         except DBusError as e:
-            self._logger.error(f'Failed to disable timer {timer_name}: {e}')
+            self._logger.error(
+                'Failed to disable timers %s: %s',
+                ', '.join(timer_names),
+                e,
+            )
             return False
 
     async def _reload_daemon(self) -> None:
         """Reload systemd daemon.
         """
-        await self._ensure_manager_proxy()
-        await self._manager_proxy.call_reload()  # type: ignore
-
-    def _generate_timer_unit(self, request: TimerCreationRequest) -> str:
-        """Generate timer unit file content.
-        """
-        lines = []
-
-        # Add unit section
-        lines.extend(self._generate_timer_unit_section(request))
-
-        # Add timer section with specifications
-        lines.extend(self._generate_timer_section(request))
-
-        # Add install section
-        lines.extend(self._generate_timer_install_section())
-
-        return '\n'.join(lines)
-
-    def _generate_timer_unit_section(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Generate [Unit] section for timer.
-        """
-        return [
-            '[Unit]',
-            f'Description={request.description}',
-            f'Documentation=Timer for {request.name}',
-            '',
-        ]
-
-    def _generate_timer_section(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Generate [Timer] section with specifications.
-        """
-        lines = ['[Timer]']
-
-        # Add timer specifications
-        timer_specs = self._get_timer_specifications(request)
-        lines.extend(timer_specs)
-
-        # Add timer behavior options
-        behavior_options = self._get_timer_behavior_options(request)
-        lines.extend(behavior_options)
-
-        return lines
-
-    def _get_timer_specifications(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Get timer schedule specifications.
-        """
-        specs = []
-
-        if request.calendar_spec:
-            specs.append(f'OnCalendar={request.calendar_spec}')
-        if request.on_boot_sec is not None:
-            specs.append(f'OnBootSec={request.on_boot_sec}')
-        if request.on_startup_sec is not None:
-            specs.append(f'OnStartupSec={request.on_startup_sec}')
-        if request.on_unit_active_sec is not None:
-            specs.append(f'OnUnitActiveSec={request.on_unit_active_sec}')
-        if request.on_unit_inactive_sec is not None:
-            specs.append(f'OnUnitInactiveSec={request.on_unit_inactive_sec}')
-
-        return specs
-
-    def _get_timer_behavior_options(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Get timer behavior options.
-        """
-        options = []
+        await self._call_manager('reload')
+        self._invalidate_timer_properties()
+        self._units_cache = None
 
-        if request.accuracy_sec != 60:
-            options.append(f'AccuracySec={request.accuracy_sec}')
-        if request.randomized_delay_sec > 0:
-            options.append(f'RandomizedDelaySec={request.randomized_delay_sec}')
-        if request.persistent:
-            options.append('Persistent=true')
-        if request.wake_system:
-            options.append('WakeSystem=true')
+    async def _call_manager(self, method: str, *args: Any) -> Any:
+        """Call a method of the systemd manager D-Bus interface.
 
-        return options
-
-    def _generate_timer_install_section(self) -> list[str]:
-        """Generate [Install] section for timer.
-        """
-        return ['', '[Install]', 'WantedBy=timers.target', '']
-
-    def _generate_service_unit(self, request: TimerCreationRequest) -> str:
-        """Generate service unit file content.
-        """
-        lines = []
-
-        # Add unit section
-        lines.extend(self._generate_service_unit_section(request))
-
-        # Add service section
-        lines.extend(self._generate_service_section(request))
-
-        lines.append('')
-
-        return '\n'.join(lines)
-
-    def _generate_service_unit_section(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Generate [Unit] section for service.
-        """
-        return [
-            '[Unit]',
-            f'Description=Service for {request.description}',
-            f'Documentation=Service unit for {request.name} timer',
-            '',
-        ]
+        Args:
+            method: Snake case method name, e.g. 'start_unit'
+            *args: Arguments of the method call
 
-    def _generate_service_section(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Generate [Service] section with configuration.
+        Returns:
+            The method reply
         """
-        lines = [
-            '[Service]',
-            'Type=oneshot',
-            f'ExecStart={request.command}',
-        ]
-
-        # Add service execution context
-        context_options = self._get_service_context_options(request)
-        lines.extend(context_options)
+        proxy = await self._ensure_manager_proxy()
+        return await getattr(proxy, f'call_{method}')(*args)
 
-        # Add environment variables
-        env_lines = self._get_service_environment_lines(request)
-        lines.extend(env_lines)
 
-        return lines
+async def _call_raw(bus: MessageBus, message: Message) -> list[Any]:
+    """Send a method call message and return the body of its reply.
 
-    def _get_service_context_options(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Get service execution context options.
-        """
-        options = []
-
-        if request.user:
-            options.append(f'User={request.user}')
-        if request.working_directory:
-            options.append(f'WorkingDirectory={request.working_directory}')
-
-        return options
+    The single place that turns error replies into exceptions for calls
+    made without a proxy.
 
-    def _get_service_environment_lines(
-        self,
-        request: TimerCreationRequest,
-    ) -> list[str]:
-        """Get environment variable lines for service.
-        """
-        lines = []
+    Args:
+        bus: Bus to send the message on
+        message: Method call message
 
-        for key, value in request.environment.items():
-            lines.append(f'Environment="{key}={value}"')
+    Returns:
+        Body of the method return
 
-        return lines
+    Raises:
+        DBusError: If the reply is an error
+    """
+    reply = await bus.call(message)
+    if reply.message_type == MessageType.ERROR:  # type: ignore
+        # Built from public fields, the error body carries the message
+        raise DBusError(
+            reply.error_name,  # type: ignore
+            reply.body[0] if reply.body else '',  # type: ignore
+            reply,
+        )
+    return reply.body  # type: ignore
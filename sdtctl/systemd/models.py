@@ -1,9 +1,12 @@
+import os
 import re
+import stat
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Self
 
-from dbus_next.signature import Variant
 from pydantic import Field, field_validator, model_validator
 
 from sdtctl.systemd.types import (
@@ -14,8 +17,12 @@ from sdtctl.systemd.types import (
 )
 from sdtctl.utils import BaseModel
 
+# Characters allowed in a systemd unit name
+_TIMER_NAME_PATTERN = re.compile(r'[a-zA-Z0-9:_.\\-]+')
 
-class TimerInfo(BaseModel):
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TimerInfo:
     """Information about a systemd timer.
 
     Args:
@@ -28,26 +35,23 @@ class TimerInfo(BaseModel):
         last_trigger: Last trigger time
         object_path: D-Bus object path
     """
-    model_config = {'frozen': True}
 
-    name: str = Field(..., min_length=1)
-    description: str = Field(...)
-    active_state: UnitActiveState = Field(...)
-    load_state: UnitLoadState = Field(...)
-    file_state: UnitFileState = Field(...)
-    next_elapse: datetime | None = Field(None)
-    last_trigger: datetime | None = Field(None)
-    object_path: str = Field(...)
-
-    @field_validator('object_path')
-    @classmethod
-    def validate_object_path(cls, v: str) -> str:
-        if not v.startswith('/'):
+    name: str
+    description: str
+    active_state: UnitActiveState
+    load_state: UnitLoadState
+    file_state: UnitFileState
+    next_elapse: datetime | None = None
+    last_trigger: datetime | None = None
+    object_path: str
+
+    def __post_init__(self) -> None:
+        if not self.object_path.startswith('/'):
             raise ValueError('Object path must start with /')
-        return v
 
 
-class TimerOperationResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TimerOperationResult:
     """Result of a timer operation.
 
     Args:
@@ -57,13 +61,12 @@ class TimerOperationResult(BaseModel):
         message: Operation result message
         job_path: D-Bus job path
     """
-    model_config = {'frozen': True}
 
-    success: bool = Field(...)
-    timer_name: str = Field(..., min_length=1)
-    operation: TimerOperation = Field(...)
-    message: str = Field('', max_length=1000)
-    job_path: str = Field('')
+    success: bool
+    timer_name: str
+    operation: TimerOperation
+    message: str = ''
+    job_path: str = ''
 
 
 class TimerCreationRequest(BaseModel):
@@ -91,16 +94,16 @@ class TimerCreationRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     description: str = Field(..., min_length=1)
     command: str = Field(..., min_length=1)
-    calendar_spec: str | None = Field(None)
+    calendar_spec: str | None = None
     on_boot_sec: int | None = Field(None, ge=0)
     on_startup_sec: int | None = Field(None, ge=0)
     on_unit_active_sec: int | None = Field(None, ge=0)
     on_unit_inactive_sec: int | None = Field(None, ge=0)
-    user: str | None = Field(None)
-    working_directory: str | None = Field(None)
+    user: str | None = None
+    working_directory: str | None = None
     environment: dict[str, str] = Field(default_factory=dict)
-    persistent: bool = Field(False)
-    wake_system: bool = Field(False)
+    persistent: bool = False
+    wake_system: bool = False
     accuracy_sec: int = Field(60, ge=0)
     randomized_delay_sec: int = Field(0, ge=0)
 
@@ -111,7 +114,7 @@ class TimerCreationRequest(BaseModel):
         base_name = v.removesuffix('.timer')
 
         # Systemd unit name validation
-        if not re.match(r'^[a-zA-Z0-9:_.\\-]+$', base_name):
+        if not _TIMER_NAME_PATTERN.fullmatch(base_name):
             raise ValueError(
                 'Timer name contains invalid characters. '
                 'Use only letters, numbers, :, _, ., \\, -'
@@ -126,27 +129,30 @@ class TimerCreationRequest(BaseModel):
     @classmethod
     def validate_working_directory(cls, v: str | None) -> str | None:
         if v is not None:
-            path = Path(v)
-            if not path.exists():
+            # A single stat tells both whether it exists and what it is
+            try:
+                mode = os.stat(v).st_mode
+            except (OSError, ValueError):
                 raise ValueError(f'Working directory does not exist: {v}')
-            if not path.is_dir():
+            if not stat.S_ISDIR(mode):
                 raise ValueError(f'Working directory is not a directory: {v}')
         return v
 
     @model_validator(mode='after')
     def validate_at_least_one_schedule(self) -> 'TimerCreationRequest':
-        if not any([
-            self.calendar_spec,
-            self.on_boot_sec,
-            self.on_startup_sec,
-            self.on_unit_active_sec,
-            self.on_unit_inactive_sec
-        ]):
+        if not (
+            self.calendar_spec
+            or self.on_boot_sec
+            or self.on_startup_sec
+            or self.on_unit_active_sec
+            or self.on_unit_inactive_sec
+        ):
             raise ValueError('At least one schedule type must be specified')
         return self
 
 
-class TimerCreationResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TimerCreationResult:
     """Result of timer creation.
 
     Args:
@@ -157,17 +163,17 @@ class TimerCreationResult(BaseModel):
         enabled: Whether the timer was enabled after creation
         error_message: Error message if creation failed
     """
-    model_config = {'frozen': True}
 
-    success: bool = Field(...)
-    timer_name: str = Field(..., min_length=1)
-    timer_path: Path | None = Field(None)
-    service_path: Path | None = Field(None)
-    enabled: bool = Field(False)
-    error_message: str = Field('', max_length=1000)
+    success: bool
+    timer_name: str
+    timer_path: Path | None = None
+    service_path: Path | None = None
+    enabled: bool = False
+    error_message: str = ''
 
 
-class TimerPreview(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TimerPreview:
     """Preview of timer unit files before creation.
 
     Args:
@@ -176,15 +182,15 @@ class TimerPreview(BaseModel):
         timer_path: Path where timer unit file will be created
         service_path: Path where service unit file will be created
     """
-    model_config = {'frozen': True}
 
-    timer_content: str = Field(..., min_length=1)
-    service_content: str = Field(..., min_length=1)
-    timer_path: Path = Field(...)
-    service_path: Path = Field(...)
+    timer_content: str
+    service_content: str
+    timer_path: Path
+    service_path: Path
 
 
-class DBusTimerProperties(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DBusTimerProperties:
     """Raw D-Bus timer properties.
 
     Args:
@@ -198,20 +204,20 @@ class DBusTimerProperties(BaseModel):
         wake_system: Timer can wake system from sleep
         remain_after_elapse: Timer remains after elapsing
     """
-    model_config = {'frozen': True}
 
-    next_elapse_realtime_usec: int = Field(..., ge=0)
-    next_elapse_monotonic_usec: int = Field(..., ge=0)
-    last_trigger_usec: int | None = Field(None, ge=0)
-    result: str | None = Field(None)
-    accuracy_usec: int = Field(..., ge=0)
-    randomized_delay_usec: int = Field(..., ge=0)
-    persistent: bool = Field(...)
-    wake_system: bool = Field(...)
-    remain_after_elapse: bool = Field(...)
+    next_elapse_realtime_usec: int = 0
+    next_elapse_monotonic_usec: int = 0
+    last_trigger_usec: int | None = None
+    result: str | None = None
+    accuracy_usec: int = 60000000
+    randomized_delay_usec: int = 0
+    persistent: bool = False
+    wake_system: bool = False
+    remain_after_elapse: bool = True
 
 
-class DBusUnitData(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DBusUnitData:
     """Raw D-Bus unit data from list_units.
 
     Args:
@@ -226,108 +232,39 @@ class DBusUnitData(BaseModel):
         job_type: Job type
         job_object_path: Job object path
     """
-    model_config = {'frozen': True}
 
-    name: str = Field(..., min_length=1)
-    description: str = Field(...)
-    load_state: str = Field(...)
-    active_state: str = Field(...)
-    sub_state: str = Field(...)
-    following: str = Field(...)
-    object_path: str = Field(...)
-    job_id: int = Field(..., ge=0)
-    job_type: str = Field(...)
-    job_object_path: str = Field(...)
-
-    @field_validator('object_path')
-    @classmethod
-    def validate_object_path(cls, v: str) -> str:
-        if not v.startswith('/'):
+    name: str
+    description: str
+    load_state: str
+    active_state: str
+    sub_state: str
+    following: str
+    object_path: str
+    job_id: int
+    job_type: str
+    job_object_path: str
+
+    def __post_init__(self) -> None:
+        if not self.object_path.startswith('/'):
             raise ValueError('Object path must start with /')
-        return v
-
-
-class DBusVariantValue(BaseModel):
-    """Wrapper for D-Bus variant values.
-
-    Args:
-        value: The wrapped D-Bus variant value
-    """
-    model_config = {'frozen': True, 'arbitrary_types_allowed': True}
-
-    value: Any = Field(...)
 
     @classmethod
-    def from_dbus_variant(cls, variant: Variant | Any | None) -> Self:
-        """Create instance from D-Bus variant.
+    def from_dbus_row(cls, row: Sequence[Any]) -> Self:
+        """Create instance from a ListUnits row.
 
         Args:
-            variant: The D-Bus variant to extract value from
+            row: Unit fields in a(ssssssouso) order
 
         Returns:
-            DBusVariantValue instance with extracted value
+            DBusUnitData instance with the row fields
         """
-        if variant and hasattr(variant, 'value'):
-            return cls(value=variant.value)
-        return cls(value=variant if variant is not None else 0)
-
-    @staticmethod
-    def to_dbus_variant(value: Any, signature: str = 'v') -> Variant:
-        """Convert a Python value to a D-Bus variant.
-
-        Args:
-            value: The Python value to convert
-            signature: The D-Bus signature (default: 'v' for variant)
-
-        Returns:
-            D-Bus Variant object
-        """
-        if signature == 'v':
-            return Variant('v', value)
-        return Variant(signature, value)
-
-
-class SystemdUnitInfo(BaseModel):
-    """Raw systemd unit information from D-Bus list_units call.
-
-    Args:
-        name: Unit name
-        description: Unit description
-        load_state: Load state
-        active_state: Active state
-        sub_state: Sub state
-        following: Following unit
-        object_path: D-Bus object path
-        job_id: Job ID
-        job_type: Job type
-        job_object_path: Job object path
-    """
-    model_config = {'frozen': True}
-
-    name: str = Field(...)
-    description: str = Field(...)
-    load_state: str = Field(...)
-    active_state: str = Field(...)
-    sub_state: str = Field(...)
-    following: str = Field(...)
-    object_path: str = Field(...)
-    job_id: int = Field(...)
-    job_type: str = Field(...)
-    job_object_path: str = Field(...)
-
-
-class TimerProperties(BaseModel):
-    """Timer-specific D-Bus properties.
+        if len(row) != _UNIT_ROW_LENGTH:
+            raise ValueError(
+                f'Expected {_UNIT_ROW_LENGTH} unit data fields, '
+                f'got {len(row)}'
+            )
+        return cls(*row)
 
-    Args:
-        next_elapse_realtime_usec: Next elapse time (realtime, microseconds)
-        next_elapse_monotonic_usec: Next elapse time (monotonic, microseconds)
-        last_trigger_usec: Last trigger time (microseconds)
-        result: Timer result
-    """
-    model_config = {'frozen': True}
 
-    next_elapse_realtime_usec: int = Field(..., ge=0)
-    next_elapse_monotonic_usec: int = Field(..., ge=0)
-    last_trigger_usec: int | None = Field(None, ge=0)
-    result: str | None = Field(None)
+# Number of fields in a ListUnits row
+_UNIT_ROW_LENGTH = len(fields(DBusUnitData))
@@ -64,6 +64,12 @@ class DBusConstants(StrEnum):
 
     # Standard D-Bus interface for properties access
     PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+    PROPERTIES_GET_ALL_METHOD = 'GetAll'
+    PROPERTIES_CHANGED_SIGNAL = 'PropertiesChanged'
+
+    # D-Bus daemon methods for subscribing to signals
+    ADD_MATCH_METHOD = 'AddMatch'
+    REMOVE_MATCH_METHOD = 'RemoveMatch'
 
 
 class SystemdDBusConstants(StrEnum):
@@ -113,3 +119,76 @@ class ConnectionConfig:
     DEFAULT_MAX_RETRIES: Final[int] = 5
     DEFAULT_INITIAL_BACKOFF: Final[float] = 1.0
     BACKOFF_MULTIPLIER: Final[float] = 2.0
+
+
+class TimerManagerConfig:
+    """Configuration constants for the timer manager."""
+
+    MAX_CONCURRENT_CALLS: Final[int] = 32
+    # Disabled unless a caller opts in, listings are fresh by default
+    UNITS_CACHE_TTL: Final[float] = 0.0
+
+
+# Introspection data of the systemd manager, limited to the members used by
+# this package. Building the proxy from it saves an Introspect round-trip
+# and parsing systemd's full introspection document.
+SYSTEMD_MANAGER_INTROSPECTION: Final[str] = """
+<node>
+  <interface name="org.freedesktop.systemd1.Manager">
+    <method name="ListUnitsByPatterns">
+      <arg type="as" name="states" direction="in"/>
+      <arg type="as" name="patterns" direction="in"/>
+      <arg type="a(ssssssouso)" name="units" direction="out"/>
+    </method>
+    <method name="ListUnitFilesByPatterns">
+      <arg type="as" name="states" direction="in"/>
+      <arg type="as" name="patterns" direction="in"/>
+      <arg type="a(ss)" name="unit_files" direction="out"/>
+    </method>
+    <method name="GetUnitFileState">
+      <arg type="s" name="file" direction="in"/>
+      <arg type="s" name="state" direction="out"/>
+    </method>
+    <method name="StartUnit">
+      <arg type="s" name="name" direction="in"/>
+      <arg type="s" name="mode" direction="in"/>
+      <arg type="o" name="job" direction="out"/>
+    </method>
+    <method name="StopUnit">
+      <arg type="s" name="name" direction="in"/>
+      <arg type="s" name="mode" direction="in"/>
+      <arg type="o" name="job" direction="out"/>
+    </method>
+    <method name="RestartUnit">
+      <arg type="s" name="name" direction="in"/>
+      <arg type="s" name="mode" direction="in"/>
+      <arg type="o" name="job" direction="out"/>
+    </method>
+    <method name="EnableUnitFiles">
+      <arg type="as" name="files" direction="in"/>
+      <arg type="b" name="runtime" direction="in"/>
+      <arg type="b" name="force" direction="in"/>
+      <arg type="b" name="carries_install_info" direction="out"/>
+      <arg type="a(sss)" name="changes" direction="out"/>
+    </method>
+    <method name="DisableUnitFiles">
+      <arg type="as" name="files" direction="in"/>
+      <arg type="b" name="runtime" direction="in"/>
+      <arg type="a(sss)" name="changes" direction="out"/>
+    </method>
+    <method name="Reload"/>
+    <method name="Subscribe"/>
+    <signal name="UnitNew">
+      <arg type="s" name="id"/>
+      <arg type="o" name="unit"/>
+    </signal>
+    <signal name="UnitRemoved">
+      <arg type="s" name="id"/>
+      <arg type="o" name="unit"/>
+    </signal>
+    <signal name="Reloading">
+      <arg type="b" name="active"/>
+    </signal>
+  </interface>
+</node>
+"""
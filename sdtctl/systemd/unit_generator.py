@@ -0,0 +1,99 @@
+from sdtctl.systemd.models import TimerCreationRequest
+
+
+def generate_timer_unit(request: TimerCreationRequest) -> str:
+    """Generate timer unit file content.
+
+    Optional settings are rendered as a whole line or an empty string,
+    so the file is built by a single f-string.
+
+    Args:
+        request: Timer creation configuration
+
+    Returns:
+        Content of the timer unit file
+    """
+    on_calendar = (
+        f'OnCalendar={request.calendar_spec}\n'
+        if request.calendar_spec else ''
+    )
+    on_boot = (
+        f'OnBootSec={request.on_boot_sec}\n'
+        if request.on_boot_sec is not None else ''
+    )
+    on_startup = (
+        f'OnStartupSec={request.on_startup_sec}\n'
+        if request.on_startup_sec is not None else ''
+    )
+    on_unit_active = (
+        f'OnUnitActiveSec={request.on_unit_active_sec}\n'
+        if request.on_unit_active_sec is not None else ''
+    )
+    on_unit_inactive = (
+        f'OnUnitInactiveSec={request.on_unit_inactive_sec}\n'
+        if request.on_unit_inactive_sec is not None else ''
+    )
+    accuracy = (
+        f'AccuracySec={request.accuracy_sec}\n'
+        if request.accuracy_sec != 60 else ''
+    )
+    randomized_delay = (
+        f'RandomizedDelaySec={request.randomized_delay_sec}\n'
+        if request.randomized_delay_sec > 0 else ''
+    )
+    persistent = 'Persistent=true\n' if request.persistent else ''
+    wake_system = 'WakeSystem=true\n' if request.wake_system else ''
+
+    return (
+        '[Unit]\n'
+        f'Description={request.description}\n'
+        f'Documentation=Timer for {request.name}\n'
+        '\n'
+        '[Timer]\n'
+        f'{on_calendar}{on_boot}{on_startup}'
+        f'{on_unit_active}{on_unit_inactive}'
+        f'{accuracy}{randomized_delay}{persistent}{wake_system}'
+        '\n'
+        '[Install]\n'
+        'WantedBy=timers.target\n'
+    )
+
+
+def generate_service_unit(request: TimerCreationRequest) -> str:
+    """Generate service unit file content.
+
+    Optional settings are rendered as a whole line or an empty string,
+    so the file is built by a single f-string.
+
+    Args:
+        request: Timer creation configuration
+
+    Returns:
+        Content of the service unit file
+    """
+    user = f'User={request.user}\n' if request.user else ''
+    working_directory = (
+        f'WorkingDirectory={request.working_directory}\n'
+        if request.working_directory else ''
+    )
+    environment = _generate_service_environment(request)
+
+    return (
+        '[Unit]\n'
+        f'Description=Service for {request.description}\n'
+        f'Documentation=Service unit for {request.name} timer\n'
+        '\n'
+        '[Service]\n'
+        'Type=oneshot\n'
+        f'ExecStart={request.command}\n'
+        f'{user}{working_directory}{environment}'
+    )
+
+
+def _generate_service_environment(request: TimerCreationRequest) -> str:
+    """Generate environment variable lines for service.
+    """
+    return ''.join([
+        f'Environment="{key}={value}"\n'
+        for key, value in request.environment.items()
+    ])
@@ -1,7 +1,9 @@
 from sdtctl.utils.base_model import BaseModel
 from sdtctl.utils.converters import StandardTimeConverter
+from sdtctl.utils.event_loop import run_async
 
 __all__ = [
     'BaseModel',
     'StandardTimeConverter',
+    'run_async',
 ]
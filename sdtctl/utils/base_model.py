@@ -8,22 +8,27 @@ class BaseModel(PydanticBaseModel):
     """Custom BaseModel.
 
     Extends Pydantic's BaseModel to automatically parse
-    docstring Args blocks and set field descriptions on model initialization.
+    docstring Args blocks and set field descriptions on model definition.
     """
 
-    def model_post_init(self, __context: Any) -> None:
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
         """Automatically set field descriptions from docstring Args block.
+
+        The docstring belongs to the class, so it is parsed once when the
+        model is defined instead of on every instance.
         """
-        super().model_post_init(__context)
-        self._set_field_descriptions_from_docstring_args()
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._set_field_descriptions_from_docstring_args()
 
-    def _set_field_descriptions_from_docstring_args(self) -> None:
+    @classmethod
+    def _set_field_descriptions_from_docstring_args(cls) -> None:
         """Set field descriptions from Args block in class docstring.
 
         Parses the class docstring looking for an Args: block and extracts
         field descriptions to set on model fields that don't have descriptions.
         """
-        docstring = self.__class__.__doc__
+        docstring = cls.__doc__
         if not docstring:
             return
 
@@ -39,7 +44,7 @@ class BaseModel(PydanticBaseModel):
         args_content = args_match.group(1)
 
         # Split into lines and process
-        lines = args_content.split('\n')
+        lines = args_content.splitlines()
         current_field = None
         current_description = []
 
@@ -48,9 +53,8 @@ class BaseModel(PydanticBaseModel):
             field_match = re.match(r'^\s*(\w+):\s*(.*)$', line)
             if field_match:
                 # Save previous field if exists
-                if current_field and \
-                    current_field in self.__class__.model_fields:
-                    self._set_field_description(
+                if current_field and current_field in cls.model_fields:
+                    cls._set_field_description(
                         current_field,
                         current_description,
                     )
@@ -68,17 +72,18 @@ class BaseModel(PydanticBaseModel):
                         current_description.append(stripped_line)
 
         # Handle the last field
-        if current_field and current_field in self.__class__.model_fields:
-            self._set_field_description(current_field, current_description)
+        if current_field and current_field in cls.model_fields:
+            cls._set_field_description(current_field, current_description)
 
+    @classmethod
     def _set_field_description(
-        self,
+        cls,
         field_name: str,
         description_parts: list[str],
     ) -> None:
         """Set description on a model field if it doesn't already have one.
         """
-        field_info = self.__class__.model_fields[field_name]
+        field_info = cls.model_fields[field_name]
         if field_info.description is None:
             description = ' '.join(description_parts).strip()
             if description:
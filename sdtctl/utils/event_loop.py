@@ -0,0 +1,19 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run_async[T](coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion in a new event loop.
+
+    Uses uvloop when it is installed (the `speedup` extra), and the default
+    asyncio event loop otherwise.
+    """
+    if uvloop is not None:
+        return uvloop.run(coroutine)
+    return asyncio.run(coroutine)
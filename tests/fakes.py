@@ -0,0 +1,209 @@
+import asyncio
+import inspect
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from dbus_next.aio.message_bus import MessageBus
+from dbus_next.aio.proxy_object import ProxyObject
+from dbus_next.constants import MessageType
+from dbus_next.errors import DBusError
+from dbus_next.message import Message
+from dbus_next.signature import Variant
+
+from sdtctl.systemd.types import (
+    DBusConstants,
+    SystemdDBusConstants,
+)
+
+# Unique name the fake bus reports as the owner of the systemd service
+SYSTEMD_OWNER = ':1.5'
+
+# Reply signature and default reply body of the methods the manager calls
+_DEFAULT_REPLIES: dict[str, tuple[str, list[Any]]] = {
+    'AddMatch': ('', []),
+    'RemoveMatch': ('', []),
+    'Subscribe': ('', []),
+    'Reload': ('', []),
+    'GetAll': ('a{sv}', [{}]),
+    'ListUnitsByPatterns': ('a(ssssssouso)', [[]]),
+    'ListUnitFilesByPatterns': ('a(ss)', [[]]),
+    'GetUnitFileState': ('s', ['enabled']),
+    'StartUnit': ('o', ['/org/freedesktop/systemd1/job/1']),
+    'StopUnit': ('o', ['/org/freedesktop/systemd1/job/1']),
+    'RestartUnit': ('o', ['/org/freedesktop/systemd1/job/1']),
+    'EnableUnitFiles': ('ba(sss)', [True, []]),
+    'DisableUnitFiles': ('a(sss)', [[]]),
+}
+
+MethodHandler = Callable[[Message], list[Any] | Awaitable[list[Any]]]
+
+
+class FakeMessageBus(MessageBus):
+    """Message bus that answers method calls in memory.
+
+    Handlers registered by member name return the reply body, or raise
+    DBusError to send an error reply. Members without a handler get their
+    default reply.
+    """
+
+    def __init__(self) -> None:
+        # No socket is opened, only the state used by proxy objects and
+        # message handlers is set up
+        self.unique_name = ':1.1'
+        self._disconnected = False
+        self._user_disconnect = False
+        self._user_message_handlers = []
+        self._match_rules = {}
+        self._name_owners = {SystemdDBusConstants.SERVICE_NAME: SYSTEMD_OWNER}
+        self._high_level_client_initialized = True
+        self._ProxyObject = ProxyObject
+        self._serial = 0
+
+        self.handlers: dict[str, MethodHandler] = {}
+        self.calls: list[Message] = []
+
+    def count_calls(self, member: str) -> int:
+        """Count the method calls made to a member.
+        """
+        return sum(1 for message in self.calls if message.member == member)
+
+    async def call(self, msg: Message) -> Message:
+        """Answer a method call from its handler or the default reply.
+        """
+        self._serial += 1
+        msg.serial = self._serial
+        self.calls.append(msg)
+
+        # Yield like a real round-trip, so concurrent calls interleave
+        await asyncio.sleep(0)
+
+        signature, body = _DEFAULT_REPLIES[msg.member]
+        handler = self.handlers.get(msg.member)
+        if handler is not None:
+            try:
+                body = handler(msg)
+                if inspect.isawaitable(body):
+                    body = await body
+            except DBusError as e:
+                return Message.new_error(msg, e.type, e.text)
+
+        return Message.new_method_return(msg, signature, body)
+
+    def _add_match_rule(self, match_rule: str) -> None:
+        self._match_rules[match_rule] = \
+            self._match_rules.get(match_rule, 0) + 1
+
+    def _remove_match_rule(self, match_rule: str) -> None:
+        self._match_rules[match_rule] -= 1
+        if not self._match_rules[match_rule]:
+            del self._match_rules[match_rule]
+
+    def emit_signal(
+        self,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str,
+        body: list[Any],
+    ) -> None:
+        """Deliver a signal sent by systemd to the message handlers.
+        """
+        message = Message(
+            message_type=MessageType.SIGNAL,
+            sender=SYSTEMD_OWNER,
+            path=path,
+            interface=interface,
+            member=member,
+            signature=signature,
+            body=body,
+        )
+        for handler in list(self._user_message_handlers):
+            handler(message)
+
+    def emit_properties_changed(
+        self,
+        path: str,
+        changed: dict[str, Variant],
+        invalidated: list[str] | None = None,
+    ) -> None:
+        """Deliver a PropertiesChanged signal of a timer unit.
+        """
+        self.emit_signal(
+            path,
+            DBusConstants.PROPERTIES_INTERFACE,
+            DBusConstants.PROPERTIES_CHANGED_SIGNAL,
+            'sa{sv}as',
+            [
+                SystemdDBusConstants.TIMER_INTERFACE,
+                changed,
+                invalidated or [],
+            ],
+        )
+
+    def emit_reloading(self, active: bool) -> None:
+        """Deliver a Reloading signal of the systemd manager.
+        """
+        self.emit_signal(
+            SystemdDBusConstants.OBJECT_PATH,
+            SystemdDBusConstants.MANAGER_INTERFACE,
+            'Reloading',
+            'b',
+            [active],
+        )
+
+
+class FakeConnection:
+    """Connection manager handing out a single fake bus.
+    """
+
+    def __init__(self, bus: FakeMessageBus) -> None:
+        self.bus = bus
+
+    async def get_bus(self) -> FakeMessageBus:
+        return self.bus
+
+
+class FakeUnitFileManager:
+    """Unit file manager that records writes instead of touching disk.
+    """
+
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.written: list[str] = []
+
+    async def write_unit_file(
+        self,
+        unit_name: str,
+        content: str,
+        system_level: bool,
+    ) -> Path:
+        await asyncio.sleep(0)
+        if unit_name in self.failing:
+            raise OSError(f'Cannot write {unit_name}')
+        self.written.append(unit_name)
+        return Path('/etc/systemd/system') / unit_name
+
+
+def timer_object_path(name: str) -> str:
+    """Object path systemd uses for a timer unit.
+    """
+    escaped = name.replace('-', '_2d')
+    return f'/org/freedesktop/systemd1/unit/{escaped}_2etimer'
+
+
+def timer_unit_row(name: str) -> list[Any]:
+    """ListUnitsByPatterns row of a loaded, waiting timer unit.
+    """
+    return [
+        f'{name}.timer',
+        f'{name} timer',
+        'loaded',
+        'active',
+        'waiting',
+        '',
+        timer_object_path(name),
+        0,
+        '',
+        '/',
+    ]
@@ -0,0 +1,307 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from dbus_next.errors import DBusError
+from dbus_next.signature import Variant
+
+from sdtctl.systemd.manager import SystemdTimerManager
+from sdtctl.systemd.models import TimerCreationRequest
+from sdtctl.utils import StandardTimeConverter
+from tests.fakes import (
+    FakeConnection,
+    FakeMessageBus,
+    FakeUnitFileManager,
+    timer_object_path,
+    timer_unit_row,
+)
+
+_NEXT_ELAPSE_USEC = 1_800_000_000_000_000
+_CHANGED_NEXT_ELAPSE_USEC = 1_900_000_000_000_000
+
+
+def _next_elapse_props(usec: int) -> list:
+    return [{'NextElapseUSecRealtime': Variant('t', usec)}]
+
+
+def _no_such_unit(name: str) -> DBusError:
+    return DBusError(
+        'org.freedesktop.systemd1.NoSuchUnit',
+        f'Unit {name} not found.',
+    )
+
+
+class ManagerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Manager on a fake bus listing the given timers.
+    """
+    timer_names = ['backup']
+
+    def make_manager(self, **kwargs) -> SystemdTimerManager:
+        manager = SystemdTimerManager(
+            connection=FakeConnection(self.bus),
+            **kwargs,
+        )
+        self.addAsyncCleanup(manager.close)
+        return manager
+
+    async def asyncSetUp(self) -> None:
+        self.bus = FakeMessageBus()
+        self.bus.handlers['ListUnitsByPatterns'] = lambda msg: [
+            [timer_unit_row(name) for name in self.timer_names],
+        ]
+        self.bus.handlers['ListUnitFilesByPatterns'] = lambda msg: [
+            [
+                [f'/etc/systemd/system/{name}.timer', 'enabled']
+                for name in self.timer_names
+            ],
+        ]
+        self.bus.handlers['GetAll'] = \
+            lambda msg: _next_elapse_props(_NEXT_ELAPSE_USEC)
+
+
+class TimerPropertiesCacheTest(ManagerTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.manager = self.make_manager(watch_changes=True)
+        self.path = timer_object_path('backup')
+
+    async def subscribe(self) -> None:
+        await self.manager._ensure_manager_proxy()
+        await self.manager._subscription_task
+
+    async def test_properties_cached_while_subscribed(self) -> None:
+        await self.subscribe()
+
+        await self.manager.list_timers()
+        await self.manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('GetAll'), 1)
+
+    async def test_properties_not_cached_without_watching(self) -> None:
+        manager = self.make_manager()
+
+        await manager.list_timers()
+        await manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('GetAll'), 2)
+        self.assertEqual(self.bus.count_calls('AddMatch'), 0)
+
+    async def test_changed_signal_updates_cached_properties(self) -> None:
+        await self.subscribe()
+        await self.manager.list_timers()
+
+        self.bus.emit_properties_changed(self.path, {
+            'NextElapseUSecRealtime': Variant('t', _CHANGED_NEXT_ELAPSE_USEC),
+        })
+        [timer] = await self.manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('GetAll'), 1)
+        self.assertEqual(
+            timer.next_elapse,
+            StandardTimeConverter().convert_realtime_to_datetime(
+                _CHANGED_NEXT_ELAPSE_USEC,
+            ),
+        )
+
+    async def test_invalidated_signal_drops_cached_properties(self) -> None:
+        await self.subscribe()
+        await self.manager.list_timers()
+
+        self.bus.emit_properties_changed(
+            self.path,
+            {},
+            ['NextElapseUSecRealtime'],
+        )
+        await self.manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('GetAll'), 2)
+
+    async def test_reloading_signal_drops_cached_properties(self) -> None:
+        await self.subscribe()
+        await self.manager.list_timers()
+
+        self.bus.emit_reloading(True)
+        await self.manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('GetAll'), 2)
+
+    async def test_signal_during_fetch_is_not_lost(self) -> None:
+        await self.subscribe()
+
+        def get_all(msg):
+            # The change is signalled after systemd read the properties,
+            # but before the reply reaches the manager
+            first_call = self.bus.count_calls('GetAll') == 1
+            if first_call:
+                self.bus.emit_properties_changed(self.path, {
+                    'NextElapseUSecRealtime':
+                        Variant('t', _CHANGED_NEXT_ELAPSE_USEC),
+                })
+                return _next_elapse_props(_NEXT_ELAPSE_USEC)
+            return _next_elapse_props(_CHANGED_NEXT_ELAPSE_USEC)
+
+        self.bus.handlers['GetAll'] = get_all
+
+        await self.manager.list_timers()
+        [timer] = await self.manager.list_timers()
+        await self.manager.list_timers()
+
+        # The stale reply was not cached, the next listing fetched again
+        # and cached the fresh one
+        self.assertEqual(self.bus.count_calls('GetAll'), 2)
+        self.assertEqual(
+            timer.next_elapse,
+            StandardTimeConverter().convert_realtime_to_datetime(
+                _CHANGED_NEXT_ELAPSE_USEC,
+            ),
+        )
+
+    async def test_close_removes_signal_handlers(self) -> None:
+        await self.subscribe()
+
+        await self.manager.close()
+
+        self.assertEqual(self.bus._user_message_handlers, [])
+        self.assertEqual(self.bus._match_rules, {})
+        self.assertEqual(self.bus.count_calls('RemoveMatch'), 1)
+
+
+class UnitsCacheTest(ManagerTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        clock_patcher = patch('sdtctl.systemd.manager.time')
+        self.clock = clock_patcher.start().monotonic
+        self.addCleanup(clock_patcher.stop)
+        self.clock.return_value = 100.0
+
+    async def test_units_reused_until_ttl_expires(self) -> None:
+        manager = self.make_manager(units_cache_ttl=5.0)
+
+        await manager.list_timers()
+        self.clock.return_value = 104.9
+        await manager.list_timers()
+        self.assertEqual(self.bus.count_calls('ListUnitsByPatterns'), 1)
+
+        self.clock.return_value = 105.0
+        await manager.list_timers()
+        self.assertEqual(self.bus.count_calls('ListUnitsByPatterns'), 2)
+
+    async def test_units_not_cached_by_default(self) -> None:
+        manager = self.make_manager()
+
+        await manager.list_timers()
+        await manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('ListUnitsByPatterns'), 2)
+
+    async def test_control_operation_drops_cached_units(self) -> None:
+        manager = self.make_manager(units_cache_ttl=5.0)
+
+        await manager.list_timers()
+        await manager.start_timer('backup')
+        await manager.list_timers()
+
+        self.assertEqual(self.bus.count_calls('ListUnitsByPatterns'), 2)
+
+
+class BulkOperationsTest(ManagerTestCase):
+    timer_names = ['backup', 'broken', 'cleanup']
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.manager = self.make_manager()
+
+    async def control_unit(self, msg):
+        unit_name = msg.body[0]
+        if unit_name == 'broken.timer':
+            raise _no_such_unit(unit_name)
+        if unit_name == 'backup.timer':
+            # Finish last, so completion order differs from request order
+            await asyncio.sleep(0.01)
+        return ['/org/freedesktop/systemd1/job/1']
+
+    async def test_control_results_in_request_order(self) -> None:
+        self.bus.handlers['StartUnit'] = self.control_unit
+        self.bus.handlers['StopUnit'] = self.control_unit
+
+        for control in (self.manager.start_timers, self.manager.stop_timers):
+            with self.subTest(control=control.__name__):
+                results = await control(self.timer_names)
+
+                self.assertEqual(
+                    [result.timer_name for result in results],
+                    self.timer_names,
+                )
+                self.assertEqual(
+                    [result.success for result in results],
+                    [True, False, True],
+                )
+                self.assertIn('broken.timer not found', results[1].message)
+
+    async def test_failed_enable_fails_every_timer(self) -> None:
+        def enable_unit_files(msg):
+            raise _no_such_unit('broken.timer')
+
+        self.bus.handlers['EnableUnitFiles'] = enable_unit_files
+
+        results = await self.manager.enable_timers(self.timer_names)
+
+        self.assertEqual(
+            [result.timer_name for result in results],
+            self.timer_names,
+        )
+        self.assertFalse(any(result.success for result in results))
+
+    async def test_create_results_in_request_order(self) -> None:
+        file_manager = FakeUnitFileManager(failing={'broken.timer'})
+        self.manager._file_manager = file_manager
+        requests = [
+            TimerCreationRequest(
+                name=name,
+                description=f'{name} timer',
+                command='/bin/true',
+                on_boot_sec=60,
+            )
+            for name in ['backup', 'broken', 'backup', 'cleanup']
+        ]
+
+        results = await self.manager.create_timers(requests)
+
+        self.assertEqual(
+            [result.timer_name for result in results],
+            ['backup', 'broken', 'backup', 'cleanup'],
+        )
+        self.assertEqual(
+            [result.success for result in results],
+            [True, False, False, True],
+        )
+        self.assertIn('Duplicate timer name', results[2].error_message)
+        [enable_call] = [
+            msg for msg in self.bus.calls if msg.member == 'EnableUnitFiles'
+        ]
+        self.assertEqual(
+            enable_call.body[0],
+            ['backup.timer', 'cleanup.timer'],
+        )
+        self.assertEqual(file_manager.written.count('backup.timer'), 1)
+
+    async def test_list_skips_failed_timers(self) -> None:
+        def get_all(msg):
+            if msg.path == timer_object_path('broken'):
+                raise _no_such_unit('broken.timer')
+            return _next_elapse_props(_NEXT_ELAPSE_USEC)
+
+        self.bus.handlers['GetAll'] = get_all
+
+        timers = await self.manager.list_timers()
+
+        self.assertEqual(
+            sorted(timer.name for timer in timers),
+            ['backup.timer', 'cleanup.timer'],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()